@@ -59,6 +59,21 @@ class TestCiGuardSignalsAbsPath(unittest.TestCase):
             results = check_signals_no_abs_windows_paths(root, [rel])
             self.assertTrue(any(r.severity == FAIL for r in results))
 
+    def test_run_dir_rel_with_escaped_key_detected(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            rel = "ops/signals/m1/fitting/LATEST.json"
+            file_path = root / rel
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            # Key spelled with a JSON escape: the raw bytes never contain "run_dir_rel"
+            file_path.write_text(
+                '{"module": "fitting", "run_dir_re\\u006c": "data/shared_m1/fitting:run3"}',
+                encoding="utf-8",
+            )
+
+            results = check_signals_no_abs_windows_paths(root, [rel])
+            self.assertTrue(any(r.severity == FAIL for r in results))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -189,5 +189,168 @@ class TestRenderWorkBriefsUnspecified(unittest.TestCase):
         self.assertNotIn("STEP_ID_MISSING", agg["fitting"]["warnings"], "1 UNSPECIFIED - 1 BACKFILLED = 0 STEP_ID_MISSING")
 
 
+class TestReplaceMarkerBlocks(unittest.TestCase):
+    """Marker replacement must match the per-module re.sub it replaced, including malformed layouts."""
+
+    CONTENT = {
+        "BLOCKERS": "- BLOCKERS: none observed",
+        "M1_SIGNALS": "- body: ok",
+        "BODY": "body \\1 \\g<0> block",
+        "FITTING": "fitting block",
+        "GARMENT": "garment block",
+    }
+
+    @staticmethod
+    def _reference(text: str, content_map: dict) -> str:
+        import re
+        from tools.render_status import MARKERS
+
+        for module, (mb, me) in MARKERS.items():
+            content = content_map.get(module)
+            if content is None:
+                continue
+            block = f"{mb}\n{content}\n{me}"
+            if mb in text and me in text:
+                text = re.sub(rf"{re.escape(mb)}[\s\S]*?{re.escape(me)}", lambda m, b=block: b, text, count=1)
+        return text
+
+    def _well_formed(self) -> str:
+        from tools.render_status import MARKERS
+
+        return "# STATUS\n\n" + "\n\n".join(f"## {k}\n{mb}\nold\n{me}" for k, (mb, me) in MARKERS.items()) + "\n"
+
+    def test_unmatched_begin_does_not_block_later_modules(self):
+        from tools.render_status import MARKERS, _replace_marker_blocks
+
+        text = self._well_formed().replace(MARKERS["BLOCKERS"][1] + "\n", "")
+        out = _replace_marker_blocks(text, self.CONTENT)
+        self.assertEqual(out, self._reference(text, self.CONTENT))
+        for module in ("BODY", "FITTING", "GARMENT"):
+            self.assertIn(self.CONTENT[module], out)
+
+    def test_matches_reference_on_random_marker_layouts(self):
+        import random
+        from tools.render_status import MARKERS, _replace_marker_blocks
+
+        markers = [m for pair in MARKERS.values() for m in pair]
+        rng = random.Random(20260207)
+        for _ in range(3000):
+            pieces = [rng.choice(markers + ["x", "\n", "old\n"]) for _ in range(rng.randint(0, 14))]
+            text = "".join(pieces)
+            content = {k: v for k, v in self.CONTENT.items() if rng.random() < 0.85}
+            self.assertEqual(_replace_marker_blocks(text, content), self._reference(text, content), repr(text))
+
+
+class TestParseRunLog(unittest.TestCase):
+    """Rows/Columns come from the head of RUN_LOG.txt, falling back to the whole log."""
+
+    def _parse(self, text):
+        from tools.render_status import _parse_run_log
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "RUN_LOG.txt"
+            path.write_bytes(text.encode("utf-8"))
+            return _parse_run_log(path)
+
+    def test_headers_at_top(self):
+        out = self._parse("Rows: 120\nColumns: 8\n" + "x\n" * 50000)
+        self.assertEqual((out["rows"], out["cols"]), (120, 8))
+        self.assertEqual(out["warnings"], [])
+
+    def test_headers_past_head_fall_back_to_full_log(self):
+        from tools.render_status import RUN_LOG_HEAD_BYTES
+
+        filler = "step ok\n" * (RUN_LOG_HEAD_BYTES // 8 + 10)
+        out = self._parse("Rows: 7\n" + filler + "Columns: 3\n")
+        self.assertEqual((out["rows"], out["cols"]), (7, 3))
+
+    def test_number_cut_at_head_boundary_is_not_misread(self):
+        from tools.render_status import RUN_LOG_HEAD_BYTES
+
+        # The head ends inside "Rows: 123456": only "Rows: 12" is within it
+        prefix = "Columns: 4\n" + "y" * (RUN_LOG_HEAD_BYTES - 20) + "\n"
+        out = self._parse(prefix + "Rows: 123456\n")
+        self.assertEqual((out["rows"], out["cols"]), (123456, 4))
+
+    def test_missing_headers_and_missing_file(self):
+        from tools.render_status import _parse_run_log
+
+        out = self._parse("no headers here\n")
+        self.assertEqual((out["rows"], out["cols"]), (None, None))
+        out = _parse_run_log(Path(tempfile.gettempdir()) / "no_such_dir" / "RUN_LOG.txt")
+        self.assertTrue(out["warnings"][0].startswith("[RUN_LOG_PARSE_FAIL]"))
+
+
+class TestRepoRel(unittest.TestCase):
+    """Repo-relative paths follow REPO_ROOT at call time and reject paths outside it."""
+
+    def setUp(self):
+        import tools.render_status as rs
+
+        self.rs = rs
+        self._orig_root = rs.REPO_ROOT
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        rs.REPO_ROOT = self.root
+
+    def tearDown(self):
+        self.rs.REPO_ROOT = self._orig_root
+        self._tmp.cleanup()
+
+    def test_follows_repointed_root(self):
+        self.assertEqual(self.rs._repo_rel(self.root / "exports" / "runs" / "x.json"), "exports/runs/x.json")
+        self.assertEqual(self.rs._repo_rel(self.root), ".")
+
+    def test_outside_root_raises(self):
+        with self.assertRaises(ValueError):
+            self.rs._repo_rel(self.root.parent / "elsewhere" / "x.json")
+        with self.assertRaises(ValueError):
+            self.rs._repo_rel(Path(str(self.root) + "_sibling") / "x.json")
+
+    def _curated(self, *parts):
+        run_dir = self.root.joinpath("data", "derived", "curated_v0", *parts)
+        run_dir.mkdir(parents=True, exist_ok=True)
+        (run_dir / "curated_v0.parquet").write_bytes(b"")
+        (run_dir / "RUN_LOG.txt").write_text("Rows: 2\nColumns: 3\n", encoding="utf-8")
+        return self.rs._latest_curated()[0]
+
+    def test_curated_run_ids(self):
+        out = self._curated("run_a")
+        self.assertEqual(out["run_id"], "run_a")
+        self.assertEqual(out["run_dir"], "data/derived/curated_v0/run_a")
+        self.assertEqual(out["parquet_path"], "data/derived/curated_v0/run_a/curated_v0.parquet")
+        self.assertEqual(out["run_log_path"], "data/derived/curated_v0/run_a/RUN_LOG.txt")
+
+    def test_curated_parquet_directly_in_base(self):
+        out = self._curated()
+        self.assertEqual(out["run_id"], ".")
+        self.assertEqual(out["run_dir"], "data/derived/curated_v0/.")
+
+
+class TestMainUnreadableStatus(unittest.TestCase):
+    def test_unreadable_status_skips_without_scanning(self):
+        import contextlib
+        import io
+        import tools.render_status as rs
+
+        orig_status, orig_curated = rs.OPS_STATUS, rs._latest_curated
+
+        def fail_scan():
+            raise AssertionError("inputs must not be collected when STATUS.md is unreadable")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            rs.OPS_STATUS = Path(tmp) / "missing" / "STATUS.md"
+            rs._latest_curated = fail_scan
+            buf = io.StringIO()
+            try:
+                with contextlib.redirect_stdout(buf):
+                    self.assertEqual(rs.main(), 0)
+            finally:
+                rs.OPS_STATUS, rs._latest_curated = orig_status, orig_curated
+        out = buf.getvalue()
+        self.assertIn("unreadable, skipped", out)
+        self.assertNotIn("updated", out)
+
+
 if __name__ == "__main__":
     unittest.main()
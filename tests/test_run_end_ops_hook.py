@@ -0,0 +1,88 @@
+"""Unit tests for run_end_ops_hook --serve request handling."""
+import json
+import socket
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO))
+
+from tools.ops import run_end_ops_hook as hook
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix domain sockets required")
+class TestServe(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.sock_path = Path(self._tmp.name) / "hook.sock"
+        self.rounds = []
+        self._orig_do_round = hook._do_round
+
+        def fake_round(args):
+            self.rounds.append(args)
+            if args.fitting_step_id == "boom":
+                raise RuntimeError("round exploded")
+            print("round ok")
+            return 0, 1
+
+        hook._do_round = fake_round
+        self.server = threading.Thread(
+            target=hook._serve, args=(self.sock_path, hook._build_parser()), daemon=True)
+        self.server.start()
+
+    def tearDown(self):
+        if self.server.is_alive():
+            self._request({"cmd": "shutdown"})
+        self.server.join(timeout=5)
+        hook._do_round = self._orig_do_round
+        self._tmp.cleanup()
+
+    def _request(self, req):
+        for _ in range(200):
+            if self.sock_path.exists():
+                break
+            threading.Event().wait(0.01)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            s.settimeout(5)
+            s.connect(str(self.sock_path))
+            with s.makefile("rwb") as f:
+                f.write(json.dumps(req).encode("utf-8") + b"\n")
+                f.flush()
+                return json.loads(f.readline())
+
+    def test_bad_argument_value_keeps_server_alive(self):
+        resp = self._request({"cmd": "run_end", "deadline": "soon"})
+        self.assertIn("error", resp)
+        self.assertIn("--deadline", resp["output"])
+        self.assertEqual(self.rounds, [])
+
+        resp = self._request({"cmd": "run_end", "deadline": 5})
+        self.assertEqual(resp["exit_code"], 0)
+        self.assertEqual(resp["warnings"], 1)
+        self.assertIn("round ok", resp["output"])
+        self.assertEqual(self.rounds[-1].deadline, 5.0)
+
+    def test_failing_round_keeps_server_alive(self):
+        resp = self._request({"cmd": "run_end", "fitting_step_id": "boom"})
+        self.assertIn("round exploded", resp["error"])
+
+        resp = self._request({"cmd": "run_end"})
+        self.assertEqual(resp["exit_code"], 0)
+
+    def test_malformed_json_and_unknown_cmd(self):
+        self.assertIn("error", self._request(["not", "an", "object"]))
+        self.assertIn("unknown cmd", self._request({"cmd": "nope"})["error"])
+        self.assertTrue(self.server.is_alive())
+
+    def test_shutdown(self):
+        self.assertEqual(self._request({"cmd": "shutdown"}), {"ok": True})
+        self.server.join(timeout=5)
+        self.assertFalse(self.server.is_alive())
+        self.assertFalse(self.sock_path.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
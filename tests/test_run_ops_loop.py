@@ -0,0 +1,140 @@
+"""Unit tests for run_ops_loop tool result severity, output capture and render steps."""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO))
+
+from tools.ops import run_ops_loop
+from tools.ops.run_ops_loop import (
+    FAIL,
+    PASS,
+    WARN,
+    ToolResult,
+    _BoundedCapture,
+    run_tool,
+)
+
+
+class TestToolResultSeverity(unittest.TestCase):
+    def _severity(self, stdout, exit_code=0):
+        return ToolResult("t", exit_code, stdout, "").severity
+
+    def test_fail_outranks_warn_on_summary_line(self):
+        self.assertEqual(self._severity("DOCTOR SUMMARY: WARN=1 FAIL=2\n"), FAIL)
+        self.assertEqual(self._severity("DOCTOR SUMMARY: FAIL=2 WARN=1\n"), FAIL)
+
+    def test_token_variants(self):
+        self.assertEqual(self._severity("X SUMMARY: 3 FAILED\n"), FAIL)
+        self.assertEqual(self._severity("X SUMMARY: 2 WARNINGS\n"), WARN)
+
+    def test_summary_without_token_is_pass(self):
+        self.assertEqual(self._severity("NEXT_STEP SUMMARY: OK\nFAIL later\n"), PASS)
+
+    def test_stdout_fallback_and_exit_code(self):
+        self.assertEqual(self._severity("header\nsome WARN here\n"), WARN)
+        self.assertEqual(self._severity("header\nFAIL\nWARN\n"), FAIL)
+        self.assertEqual(self._severity("X SUMMARY: OK\n", exit_code=2), FAIL)
+
+
+class TestBoundedCapture(unittest.TestCase):
+    def test_head_tail_and_omitted_marker(self):
+        cap = _BoundedCapture(head=2, tail=2)
+        for line in ["h1", "h2", "x WARN", "y FAIL", "z", "t1", "t2"]:
+            cap.feed(line)
+        self.assertEqual(cap.text().splitlines(),
+                         ["h1", "h2", "... (3 lines omitted, FAIL seen)", "t1", "t2"])
+        self.assertEqual(ToolResult("t", 0, cap.text(), "").severity, FAIL)
+
+    def test_short_stream_kept_verbatim(self):
+        cap = _BoundedCapture(head=2, tail=2)
+        for line in ["a", "b", "c"]:
+            cap.feed(line)
+        self.assertEqual(cap.text(), "a\nb\nc")
+
+
+class TestRunTool(unittest.TestCase):
+    def _tool(self, tmp, source):
+        path = Path(tmp) / "tool.py"
+        path.write_text(source, encoding="utf-8")
+        return "tool.py"
+
+    def test_output_is_bounded(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            tool = self._tool(tmp, "for i in range(500):\n    print(f'line {i}')\n")
+            r = run_tool(Path(tmp), tool, [], timeout=30)
+        self.assertEqual(r.exit_code, 0)
+        lines = r.lines()
+        self.assertEqual(lines[0], "line 0")
+        self.assertEqual(lines[-1], "line 499")
+        self.assertIn("lines omitted", r.stdout)
+        self.assertLess(len(lines), 100)
+
+    def test_timeout_returns_while_grandchild_holds_pipe(self):
+        source = (
+            "import subprocess, sys, time\n"
+            "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(6)'])\n"
+            "time.sleep(6)\n"
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            tool = self._tool(tmp, source)
+            start = time.monotonic()
+            r = run_tool(Path(tmp), tool, [], timeout=1)
+            elapsed = time.monotonic() - start
+        self.assertEqual(r.exit_code, 1)
+        self.assertIn("Timeout", r.stderr)
+        self.assertLess(elapsed, 4)
+
+
+class TestRenders(unittest.TestCase):
+    def _make_repo(self, root: Path) -> Path:
+        (root / "project_map.md").write_text("", encoding="utf-8")
+        calls = root / "calls.txt"
+        stub = ("import sys\n"
+                "open({calls!r}, 'a').write({name!r} + '\\n')\n"
+                "print({name!r} + ' SUMMARY: OK')\n")
+        tools = dict(run_ops_loop.CORE_TOOLS)
+        tools.update(run_ops_loop.OPTIONAL_TOOLS)
+        for name, rel in tools.items():
+            path = root / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(stub.format(calls=str(calls), name=name), encoding="utf-8")
+        return calls
+
+    def _main(self, root: Path, *argv: str) -> None:
+        cwd = os.getcwd()
+        os.chdir(root)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                run_ops_loop.main(list(argv) + ["--json"])
+        finally:
+            os.chdir(cwd)
+
+    def test_renders_run_every_loop(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp).resolve()
+            calls = self._make_repo(root)
+
+            def renders():
+                lines = calls.read_text(encoding="utf-8").splitlines()
+                calls.unlink()
+                return [l for l in lines if l.startswith("render_")]
+
+            self._main(root, "--mode", "quick")
+            self.assertEqual(renders(), ["render_status"])
+            self._main(root, "--mode", "quick")
+            self.assertEqual(renders(), ["render_status"])
+            self._main(root, "--mode", "full")
+            self.assertEqual(renders(), ["render_work_briefs", "render_status"])
+            self._main(root, "--mode", "full", "--skip-render")
+            self.assertEqual(renders(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -413,6 +413,35 @@ class TestRunMinsetAndRoundEnd(unittest.TestCase):
             self.assertIn("FITTING", result)
             self.assertGreater(len(result["FITTING"]), 0, "2 start, 1 end -> ROUND_END_MISSING")
 
+    def test_check_round_end_missing_keeps_partial_body_counts(self):
+        import tools.render_status as mod
+        from datetime import datetime, timezone
+
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S+00:00")
+
+        def write_log(root, module):
+            progress_dir = root / "exports" / "progress"
+            progress_dir.mkdir(parents=True)
+            lines = [json.dumps({"ts": now, "module": module, "event": "round_start"})] * 2
+            # A non-object line aborts the scan; the ROUND_ENDs after it are never counted
+            lines.append("[1]")
+            lines += [json.dumps({"ts": now, "module": module, "event": "round_end"})] * 3
+            (progress_dir / "PROGRESS_LOG.jsonl").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            orig_repo = mod.REPO_ROOT
+            mod.REPO_ROOT = Path(tmp) / "repo"
+            try:
+                write_log(mod.REPO_ROOT, "body")
+                lab_root = Path(tmp) / "fitting_lab"
+                write_log(lab_root, "fitting")
+                result = mod._check_round_end_missing([(lab_root, "fitting")], hours=24)
+            finally:
+                mod.REPO_ROOT = orig_repo
+        self.assertEqual(result["BODY"], ["expected=roundwrap end required"],
+                         "body: 2 starts counted before the read error still count")
+        self.assertEqual(result["FITTING"], [], "lab log with a read error is skipped")
+
 
 class TestRunRegistryIntegration(unittest.TestCase):
     """Integration test: ROUND_END with exports/runs path -> registry append."""
@@ -583,5 +612,141 @@ class TestRunRegistryIntegration(unittest.TestCase):
             self.assertIn("REGISTRY_MANIFEST_MISMATCH", rec.get("gate_codes", []))
 
 
+class TestRunRegistryDedup(unittest.TestCase):
+    """Registry dedup across runs: already-registered keys are skipped, newer ones still appended."""
+
+    @staticmethod
+    def _round_end(round_id: str, run_id: str) -> dict:
+        return {
+            "ts": "2026-02-07T12:00:00+00:00",
+            "module": "fitting",
+            "event": "round_end",
+            "round_id": round_id,
+            "step_id": "F08",
+            "evidence": [f"exports/runs/_smoke/{run_id}/geometry_manifest.json"],
+        }
+
+    def _run_main(self, tmp: str, lab_root: Path, registry_path: Path) -> None:
+        import tools.ops.update_run_registry as mod
+
+        orig = (mod.RUN_REGISTRY, mod.LAB_ROOTS_PATH, mod.REPO_ROOT)
+        try:
+            mod.RUN_REGISTRY = registry_path
+            mod.LAB_ROOTS_PATH = Path(tmp) / "lab_roots.json"
+            mod.LAB_ROOTS_PATH.write_text(json.dumps({"FITTING_LAB_ROOT": str(lab_root)}), encoding="utf-8")
+            mod.REPO_ROOT = Path(tmp)
+            mod.main()
+        finally:
+            mod.RUN_REGISTRY, mod.LAB_ROOTS_PATH, mod.REPO_ROOT = orig
+
+    def test_registered_key_repeated_after_new_event(self):
+        """Log X, Y, X with X already registered: Y must still be appended (key order != log order)."""
+        with tempfile.TemporaryDirectory() as tmp:
+            lab_root = Path(tmp) / "fitting_lab"
+            progress_dir = lab_root / "exports" / "progress"
+            progress_dir.mkdir(parents=True)
+            log_path = progress_dir / "PROGRESS_LOG.jsonl"
+            registry_path = Path(tmp) / "run_registry.jsonl"
+
+            x = self._round_end("round_x", "RUN_X")
+            log_path.write_text(json.dumps(x) + "\n", encoding="utf-8")
+            self._run_main(tmp, lab_root, registry_path)
+
+            y = self._round_end("round_y", "RUN_Y")
+            with open(log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(y) + "\n" + json.dumps(x) + "\n")
+            self._run_main(tmp, lab_root, registry_path)
+            self._run_main(tmp, lab_root, registry_path)
+
+            recs = [json.loads(ln) for ln in registry_path.read_text(encoding="utf-8").splitlines() if ln.strip()]
+            self.assertEqual([r["round_id"] for r in recs], ["round_x", "round_y"])
+
+    def test_index_rebuilt_when_registry_changed_without_it(self):
+        """Registry appended by a writer that skips the sidecar: size mismatch forces a rebuild,
+        even if the sidecar's mtime looks as new as the registry's (coarse mtimes)."""
+        import os
+        import tools.ops.update_run_registry as mod
+
+        with tempfile.TemporaryDirectory() as tmp:
+            registry_path = Path(tmp) / "run_registry.jsonl"
+            rec_a = {"module": "fitting", "lane": "_smoke", "run_id": "RUN_A", "round_id": "ra"}
+            registry_path.write_text(json.dumps(rec_a) + "\n", encoding="utf-8")
+            self.assertEqual(mod._get_existing_keys(registry_path), {("fitting", "_smoke", "RUN_A", "ra")})
+            idx_path = mod._index_path(registry_path)
+            self.assertTrue(idx_path.exists())
+
+            rec_b = {"module": "fitting", "lane": "_smoke", "run_id": "RUN_B", "round_id": "rb"}
+            with open(registry_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(rec_b) + "\n")
+            st = registry_path.stat()
+            os.utime(idx_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+            keys = mod._get_existing_keys(registry_path)
+            self.assertIn(("fitting", "_smoke", "RUN_B", "rb"), keys)
+            self.assertEqual(len(keys), 2)
+
+    def test_index_rebuild_is_atomic(self):
+        """A rebuild that fails before the rename leaves the previous sidecar intact and no tmp file."""
+        from unittest import mock
+        import tools.ops.update_run_registry as mod
+
+        with tempfile.TemporaryDirectory() as tmp:
+            registry_path = Path(tmp) / "run_registry.jsonl"
+            rec_a = {"module": "fitting", "lane": "_smoke", "run_id": "RUN_A", "round_id": "ra"}
+            registry_path.write_text(json.dumps(rec_a) + "\n", encoding="utf-8")
+            mod._get_existing_keys(registry_path)
+            idx_path = mod._index_path(registry_path)
+            before = idx_path.read_bytes()
+
+            rec_b = {"module": "fitting", "lane": "_smoke", "run_id": "RUN_B", "round_id": "rb"}
+            with open(registry_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(rec_b) + "\n")
+            with mock.patch.object(mod.os, "replace", side_effect=OSError("simulated crash")):
+                keys = mod._get_existing_keys(registry_path)
+            self.assertEqual(len(keys), 2)
+            self.assertEqual(idx_path.read_bytes(), before)
+            self.assertEqual(sorted(p.name for p in Path(tmp).iterdir()),
+                             ["run_registry.idx", "run_registry.jsonl"])
+
+            # Next call rebuilds for real: the stale header no longer matches the registry size
+            self.assertEqual(mod._get_existing_keys(registry_path), keys)
+            with open(idx_path, "rb") as f:
+                self.assertEqual(mod._index_registry_size(f.readline()), registry_path.stat().st_size)
+
+    def test_index_append_path_and_separator_in_run_id(self):
+        """main() extends the sidecar in step with the registry; fields with '|' round-trip intact."""
+        import tools.ops.update_run_registry as mod
+
+        with tempfile.TemporaryDirectory() as tmp:
+            lab_root = Path(tmp) / "fitting_lab"
+            progress_dir = lab_root / "exports" / "progress"
+            progress_dir.mkdir(parents=True)
+            log_path = progress_dir / "PROGRESS_LOG.jsonl"
+            registry_path = Path(tmp) / "run_registry.jsonl"
+
+            log_path.write_text(json.dumps(self._round_end("r|1", "RUN|A")) + "\n", encoding="utf-8")
+            self._run_main(tmp, lab_root, registry_path)
+            with open(log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(self._round_end("r2", "RUN_B")) + "\n")
+            self._run_main(tmp, lab_root, registry_path)
+
+            idx_path = mod._index_path(registry_path)
+            with open(idx_path, "rb") as f:
+                self.assertEqual(mod._index_registry_size(f.readline()), registry_path.stat().st_size)
+
+            orig_parse = mod._parse_registry_keys
+            mod._parse_registry_keys = None  # sidecar must be trusted, not rebuilt
+            try:
+                keys = mod._get_existing_keys(registry_path)
+            finally:
+                mod._parse_registry_keys = orig_parse
+            self.assertEqual(
+                keys,
+                {("fitting", "_smoke", "RUN|A", "r|1"), ("fitting", "_smoke", "RUN_B", "r2")},
+            )
+            recs = registry_path.read_text(encoding="utf-8").splitlines()
+            self.assertEqual(len(recs), 2)
+
+
 if __name__ == "__main__":
     unittest.main()
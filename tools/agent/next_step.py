@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import sys
 from pathlib import Path
@@ -28,11 +29,10 @@ def _safe_print(text: str = "") -> None:
         print(text.encode("ascii", errors="replace").decode("ascii"))
 
 
-def find_repo_root(start_dir: Optional[Path] = None) -> Optional[Path]:
-    """Find repository root by walking up until .git/ or project_map.md."""
-    if start_dir is None:
-        start_dir = Path.cwd()
-    current = start_dir.resolve()
+@functools.lru_cache(maxsize=16)
+def _repo_root_from(start: Path) -> Optional[Path]:
+    """Walk up from resolved *start*; memoized so repeated lookups skip the stat walk."""
+    current = start
     while True:
         if (current / ".git").is_dir():
             return current
@@ -44,6 +44,13 @@ def find_repo_root(start_dir: Optional[Path] = None) -> Optional[Path]:
         current = parent
 
 
+def find_repo_root(start_dir: Optional[Path] = None) -> Optional[Path]:
+    """Find repository root by walking up until .git/ or project_map.md."""
+    if start_dir is None:
+        start_dir = Path.cwd()
+    return _repo_root_from(start_dir.resolve())
+
+
 def _norm_level(value: Any) -> str:
     if isinstance(value, str) and value in LEVELS:
         return value
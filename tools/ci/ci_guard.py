@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import re
 import subprocess
@@ -23,8 +24,8 @@ PROGRESS_LOG_PATHS = [
 ]
 STATUS_PATHS = ["ops/STATUS.md", "STATUS.md"]
 SIGNALS_PREFIX = "ops/signals/"
-ABS_WIN_RE = re.compile(r"[A-Za-z]:\\")
-ABS_USERS_RE = re.compile(r"\\\\Users\\\\", re.IGNORECASE)
+# Drive-letter prefix or \\Users\\ in one pass over the raw file bytes (both patterns are ASCII)
+ABS_WIN_RE = re.compile(rb"[A-Za-z]:\\|(?i:\\\\Users\\\\)")
 
 
 class CheckResult:
@@ -43,10 +44,10 @@ def _safe_print(text: str = "") -> None:
         print(text.encode("ascii", errors="replace").decode("ascii"))
 
 
-def find_repo_root(start_dir: Optional[Path] = None) -> Optional[Path]:
-    if start_dir is None:
-        start_dir = Path.cwd()
-    current = start_dir.resolve()
+@functools.lru_cache(maxsize=16)
+def _repo_root_from(start: Path) -> Optional[Path]:
+    """Walk up from resolved *start*; memoized so repeated lookups skip the stat walk."""
+    current = start
     while True:
         if (current / ".git").is_dir():
             return current
@@ -58,6 +59,12 @@ def find_repo_root(start_dir: Optional[Path] = None) -> Optional[Path]:
         current = parent
 
 
+def find_repo_root(start_dir: Optional[Path] = None) -> Optional[Path]:
+    if start_dir is None:
+        start_dir = Path.cwd()
+    return _repo_root_from(start_dir.resolve())
+
+
 def _run_git(repo_root: Path, args: List[str]) -> Tuple[str, Optional[str]]:
     try:
         result = subprocess.run(
@@ -198,17 +205,17 @@ def check_signals_no_abs_windows_paths(repo_root: Path, changed_files: List[str]
         if not path.is_file():
             continue
         try:
-            content = path.read_text(encoding="utf-8", errors="replace")
+            data = path.read_bytes()
         except OSError as exc:
             results.append(CheckResult(WARN, f"signals_abs_path:{rel}", f"read failed: {exc}"))
             continue
-        if ABS_WIN_RE.search(content) or ABS_USERS_RE.search(content):
+        if ABS_WIN_RE.search(data):
             violations.append((rel, "windows absolute path pattern detected"))
             continue
 
         # If this is JSON and has run_dir_rel, enforce relative path safety.
         try:
-            payload = json.loads(content)
+            payload = json.loads(data.decode("utf-8", errors="replace"))
         except json.JSONDecodeError:
             continue
 
@@ -61,6 +61,14 @@ ALLOWLIST = [
     "tools/render_work_briefs.py",
 ]
 
+# Prefix tuples built once so each check is a single str.startswith call
+_FORBIDDEN_EXACT = frozenset(p.rstrip("/") for p in FORBIDDEN_LOCAL)
+_FORBIDDEN_PREFIXES = tuple(p if p.endswith("/") else p + "/" for p in FORBIDDEN_LOCAL)
+_ALLOWLIST_PREFIXES = tuple(ALLOWLIST)
+_BODY_PREFIXES = tuple(BODY_REGIONS)
+_FITTING_PREFIXES = tuple(FITTING_REGIONS)
+_GARMENT_PREFIXES = tuple(GARMENT_REGIONS)
+
 
 def normalize_path(path: str) -> str:
     """Normalize path to use forward slashes (OS-independent)."""
@@ -70,50 +78,27 @@ def normalize_path(path: str) -> str:
 def is_forbidden_local(file_path: str) -> bool:
     """Check if file is in forbidden local-only paths (never commit)."""
     normalized = normalize_path(file_path)
-    for pattern in FORBIDDEN_LOCAL:
-        if pattern.endswith("/"):
-            if normalized == pattern.rstrip("/") or normalized.startswith(pattern):
-                return True
-        else:
-            if normalized == pattern or normalized.startswith(pattern + "/"):
-                return True
-    return False
+    return normalized in _FORBIDDEN_EXACT or normalized.startswith(_FORBIDDEN_PREFIXES)
 
 
 def is_allowlisted(file_path: str) -> bool:
     """Check if file is in allowlist."""
-    normalized = normalize_path(file_path)
-    for allowed in ALLOWLIST:
-        if normalized == allowed or normalized.startswith(allowed):
-            return True
-    return False
+    return normalize_path(file_path).startswith(_ALLOWLIST_PREFIXES)
 
 
 def is_body_region(file_path: str) -> bool:
     """Check if file is in body (legacy) region."""
-    normalized = normalize_path(file_path)
-    for region in BODY_REGIONS:
-        if normalized.startswith(region):
-            return True
-    return False
+    return normalize_path(file_path).startswith(_BODY_PREFIXES)
 
 
 def is_fitting_region(file_path: str) -> bool:
     """Check if file is in fitting region."""
-    normalized = normalize_path(file_path)
-    for region in FITTING_REGIONS:
-        if normalized.startswith(region):
-            return True
-    return False
+    return normalize_path(file_path).startswith(_FITTING_PREFIXES)
 
 
 def is_garment_region(file_path: str) -> bool:
     """Check if file is in garment region."""
-    normalized = normalize_path(file_path)
-    for region in GARMENT_REGIONS:
-        if normalized.startswith(region):
-            return True
-    return False
+    return normalize_path(file_path).startswith(_GARMENT_PREFIXES)
 
 
 def get_changed_files(base: str, head: str) -> list[str]:
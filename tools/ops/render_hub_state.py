@@ -13,6 +13,7 @@ from __future__ import annotations
 import fnmatch
 import json
 import os
+import re
 from pathlib import Path
 from datetime import datetime, timezone
 
@@ -28,6 +29,8 @@ BRIEF_DIR = REPO_ROOT / "exports" / "brief"
 STATUS_PATH = REPO_ROOT / "ops" / "STATUS.md"
 
 MODULES = ("body", "fitting", "garment")
+OBSERVED_EVENTS_LOOKBACK = 30
+TAIL_BLOCK_SIZE = 64 * 1024
 
 
 def _warn(code: str, message: str) -> str:
@@ -89,23 +92,20 @@ def _artifact_observed(plan: dict, artifact_id: str, search_roots: list[Path]) -
     patterns = art.get("path_glob_any") or []
     if not patterns:
         return False
+    # One regex for all globs; normcase both sides as fnmatch.fnmatch does
+    match = re.compile("|".join(fnmatch.translate(os.path.normcase(pat)) for pat in patterns)).match
+    # Plain str paths from os.walk: no per-file Path objects, relative_to() or is_file() stat
     for root in search_roots:
-        runs_dir = root / "exports" / "runs"
-        if not runs_dir.exists():
-            continue
-        try:
-            for p in runs_dir.rglob("*"):
-                if not p.is_file():
-                    continue
-                try:
-                    rel = p.relative_to(root).as_posix()
-                except ValueError:
-                    continue
-                for pat in patterns:
-                    if fnmatch.fnmatch(rel, pat):
-                        return True
-        except OSError:
-            continue
+        root_str = str(root)
+        runs_dir = os.path.join(root_str, "exports", "runs")
+        cut = len(root_str) + 1
+        for dirpath, _dirnames, filenames in os.walk(runs_dir):
+            rel_dir = dirpath[cut:]
+            if os.sep != "/":
+                rel_dir = rel_dir.replace(os.sep, "/")
+            for name in filenames:
+                if match(os.path.normcase(f"{rel_dir}/{name}")):
+                    return True
     return False
 
 
@@ -473,30 +473,49 @@ def _render_dashboard(plan: dict, artifacts_observed: dict[str, bool], unlocks:
     return "\n".join(lines)
 
 
+def _iter_lines_reverse(path: Path, block_size: int = TAIL_BLOCK_SIZE):
+    """Yield non-empty lines of path newest-first, reading backward from EOF in blocks."""
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        rest = b""
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step) + rest
+            parts = chunk.split(b"\n")
+            rest = parts[0]
+            for raw in reversed(parts[1:]):
+                raw = raw.strip()
+                if raw:
+                    yield raw.decode("utf-8")
+        rest = rest.strip()
+        if rest:
+            yield rest.decode("utf-8")
+
+
 def _extract_observed_paths_for_module(lab_root: Path, module: str, max_items: int = 3) -> list[str]:
     """Extract evidence paths from PROGRESS_LOG for module. Returns display paths."""
     log_path = lab_root / "exports" / "progress" / "PROGRESS_LOG.jsonl"
-    if not log_path.exists():
-        return []
     mod_lower = module.lower()
+    # Only the last OBSERVED_EVENTS_LOOKBACK events for the module matter; scan from EOF
     events = []
     try:
-        with open(log_path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    ev = json.loads(line)
-                    if ev.get("module", "").lower() == mod_lower:
-                        events.append(ev)
-                except json.JSONDecodeError:
-                    continue
-    except Exception:
+        for line in _iter_lines_reverse(log_path):
+            try:
+                ev = json.loads(line)
+                if ev.get("module", "").lower() == mod_lower:
+                    events.append(ev)
+                    if len(events) >= OBSERVED_EVENTS_LOOKBACK:
+                        break
+            except json.JSONDecodeError:
+                continue
+    except Exception:  # missing/unreadable log
         return []
+    events.reverse()
     seen = set()
     out = []
-    for ev in events[-30:]:
+    for ev in events:
         if len(out) >= max_items:
             break
         for key in ("evidence", "artifacts_touched", "evidence_paths"):
@@ -533,7 +552,6 @@ def _parse_status_observed_paths() -> dict[str, list[str]]:
         text = STATUS_PATH.read_text(encoding="utf-8")
     except Exception:
         return out
-    import re
     for mod in ("BODY", "FITTING", "GARMENT"):
         block = re.search(
             rf"<!-- GENERATED:BEGIN:{mod} -->([\s\S]*?)<!-- GENERATED:END:{mod} -->",
@@ -4,44 +4,96 @@ Run-end ops hook: B2 unlock readiness (if beta_fit run found) → append progres
 Called from postprocess_round or run completion. Exit 0 by default. Facts-only; never gate.
 With --restore-generated (Round 09): restores ops/STATUS.md and removes temp files after render.
 With --strict-clean (Round 10): FAIL if working tree dirty at start or end.
+With --deadline SECS: shared time budget for the render pair (each render <= 180s).
+With --serve [--socket PATH]: long-running mode for CI loops. Listens on a Unix domain
+socket (default ops/.hook.sock) and runs one round per newline-delimited JSON request,
+e.g. {"cmd": "run_end", "strict_clean": true}; replies {"exit_code", "warnings", "output"}.
+{"cmd": "shutdown"} stops the server.
 """
 import argparse
+import contextlib
+import functools
+import io
+import itertools
 import json
 import os
+import shutil
+import socket
 import subprocess
 import sys
+import time
 from pathlib import Path
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 REPO_ROOT = Path(__file__).resolve().parents[2]
+LAB_ROOTS_CFG = REPO_ROOT / "ops" / "lab_roots.local.json"
+
+# git executable, resolved once (avoids a PATH/PATHEXT search per spawn)
+_GIT = shutil.which("git") or "git"
 
 # B2 unlock: default thresholds (must match generate_unlock_signal_b2_v0.py defaults when used)
 B2_THRESHOLD_SCORE = 70.0
 B2_THRESHOLD_RESIDUAL_P90_CM = 1.0
 B2_MAX_FAILURES = 0
 
+# Static part of the B2 generator argv (built once at import)
+_B2_CMD_BASE = (
+    sys.executable,
+    str(REPO_ROOT / "tools" / "generate_unlock_signal_b2_v0.py"),
+    "--threshold_score", "70",
+    "--threshold_residual_p90_cm", "1.0",
+    "--max_failures", "0",
+)
 
-def _get_lab_roots() -> dict[str, Path | None]:
-    """ENV > lab_roots.local.json. Returns fitting, garment roots or None."""
-    roots = {"fitting": None, "garment": None}
-    for k, env_key in (("fitting", "FITTING_LAB_ROOT"), ("garment", "GARMENT_LAB_ROOT")):
-        v = os.environ.get(env_key, "").strip()
-        if v:
-            roots[k] = Path(v).resolve()
-        else:
-            roots[k] = None
+# Render scripts: per-script timeout cap and default shared budget (seconds)
+RENDER_TIMEOUT_SEC = 180
+DEFAULT_DEADLINE_SEC = 600
 
-    if roots["fitting"] is None or roots["garment"] is None:
-        cfg_path = REPO_ROOT / "ops" / "lab_roots.local.json"
-        if cfg_path.exists():
-            try:
-                with open(cfg_path, encoding="utf-8") as f:
-                    cfg = json.load(f)
-                for k, key in (("fitting", "FITTING_LAB_ROOT"), ("garment", "GARMENT_LAB_ROOT")):
-                    if roots[k] is None and cfg.get(key):
-                        roots[k] = (REPO_ROOT / cfg[key]).resolve()
-            except Exception:
-                pass
-    return roots
+DEFAULT_SOCKET_PATH = REPO_ROOT / "ops" / ".hook.sock"
+
+
+_LAB_ROOT_KEYS = (("fitting", "FITTING_LAB_ROOT"), ("garment", "GARMENT_LAB_ROOT"))
+
+
+def _stat_key(path: Path):
+    """(mtime_ns, size) of path, or None if missing. Used as a cache key."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=1)
+def _lab_roots_for(env_values: tuple[str, ...], cfg_key) -> tuple[tuple[str, Path | None], ...]:
+    """Resolve lab roots for a given env snapshot + config stat (memoized)."""
+    roots: dict[str, Path | None] = {}
+    for (k, _), v in zip(_LAB_ROOT_KEYS, env_values):
+        roots[k] = Path(os.path.abspath(v)) if v else None
+
+    if None in roots.values() and cfg_key is not None:
+        try:
+            cfg = _loads(LAB_ROOTS_CFG.read_bytes())
+            for k, key in _LAB_ROOT_KEYS:
+                if roots[k] is None and cfg.get(key):
+                    roots[k] = Path(os.path.abspath(REPO_ROOT / cfg[key]))
+        except Exception:
+            pass
+    return tuple(roots.items())
+
+
+def _get_lab_roots() -> dict[str, Path | None]:
+    """ENV > lab_roots.local.json. Returns fitting, garment roots or None.
+    Memoized on (env values, lab_roots.local.json mtime/size)."""
+    env = os.environ
+    env_values = tuple(env.get(env_key, "").strip() for _, env_key in _LAB_ROOT_KEYS)
+    cfg_key = _stat_key(LAB_ROOTS_CFG) if "" in env_values else None
+    return dict(_lab_roots_for(env_values, cfg_key))
 
 
 def _b2_unlock_rules_match(unlock_path: Path) -> bool:
@@ -49,8 +101,7 @@ def _b2_unlock_rules_match(unlock_path: Path) -> bool:
     if not unlock_path.exists():
         return False
     try:
-        with open(unlock_path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = _loads(unlock_path.read_bytes())
         rules = data.get("rules") or {}
         return (
             rules.get("threshold_score") == B2_THRESHOLD_SCORE
@@ -85,7 +136,8 @@ def _run_b2_unlock_readiness() -> None:
                     "--note", "B2 unlock signal skipped: no beta_fit_v0 summary.json found",
                 ],
                 cwd=str(REPO_ROOT),
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=False,
             )
         except Exception:
@@ -97,15 +149,8 @@ def _run_b2_unlock_readiness() -> None:
     rules_match = _b2_unlock_rules_match(unlock_path)
     log_progress = not rules_match
 
-    cmd = [
-        sys.executable,
-        str(REPO_ROOT / "tools" / "generate_unlock_signal_b2_v0.py"),
-        "--run_dir", str(run_dir),
-        "--out_dir", str(run_dir),
-        "--threshold_score", "70",
-        "--threshold_residual_p90_cm", "1.0",
-        "--max_failures", "0",
-    ]
+    run_dir_s = str(run_dir)
+    cmd = [*_B2_CMD_BASE, "--run_dir", run_dir_s, "--out_dir", run_dir_s]
     if log_progress:
         cmd.append("--log-progress")
 
@@ -120,7 +165,7 @@ def _git_status_porcelain(repo_root: Path):
     """Run git status --porcelain.  Returns (stdout, error_msg)."""
     try:
         r = subprocess.run(
-            ["git", "status", "--porcelain"],
+            [_GIT, "status", "--porcelain"],
             cwd=str(repo_root), capture_output=True, text=True,
             encoding="utf-8", errors="replace", timeout=15,
         )
@@ -131,16 +176,41 @@ def _git_status_porcelain(repo_root: Path):
         return None, str(exc)
 
 
+def _git_is_clean_fast(repo_root: Path):
+    """Cheap clean check: diff-index vs HEAD + untracked listing.
+    Returns True/False, or None if git could not answer (caller falls back)."""
+    try:
+        r = subprocess.run(
+            [_GIT, "diff-index", "--quiet", "HEAD", "--"],
+            cwd=str(repo_root), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            timeout=15,
+        )
+        if r.returncode == 1:
+            return False
+        if r.returncode != 0:
+            return None
+        r = subprocess.run(
+            [_GIT, "ls-files", "--others", "--exclude-standard"],
+            cwd=str(repo_root), capture_output=True, timeout=15,
+        )
+        if r.returncode != 0:
+            return None
+        return not r.stdout.strip()
+    except Exception:
+        return None
+
+
 def _is_clean(porcelain_output: str) -> bool:
     return porcelain_output.strip() == ""
 
 
 def _dirty_files_summary(porcelain_output: str, max_lines: int = 20) -> str:
-    lines = [l for l in porcelain_output.strip().splitlines() if l.strip()]
-    shown = lines[:max_lines]
+    it = (l for l in porcelain_output.splitlines() if l.strip())
+    shown = list(itertools.islice(it, max_lines))
+    rest = sum(1 for _ in it)
     text = "\n".join(f"    {l}" for l in shown)
-    if len(lines) > max_lines:
-        text += f"\n    ... ({len(lines) - max_lines} more)"
+    if rest:
+        text += f"\n    ... ({rest} more)"
     return text
 
 
@@ -156,8 +226,9 @@ def _cleanup_generated(repo_root: Path) -> None:
             continue
         try:
             r = subprocess.run(
-                ["git", "restore", rel_path],
-                cwd=str(repo_root), capture_output=True, text=True, timeout=15,
+                [_GIT, "restore", rel_path],
+                cwd=str(repo_root), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                timeout=15,
             )
             if r.returncode == 0:
                 print(f"[CLEANUP] {rel_path}: restored")
@@ -178,7 +249,7 @@ def _cleanup_generated(repo_root: Path) -> None:
             print(f"[CLEANUP] {rel_path}: warn ({exc})")
 
 
-def main() -> int:
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Run-end ops hook (R09 restore / R10 strict-clean)")
     parser.add_argument("--restore-generated", action="store_true",
@@ -193,17 +264,112 @@ def main() -> int:
                         help="(legacy) Fitting step ID override")
     parser.add_argument("--garment-step-id", type=str, default=None,
                         help="(legacy) Garment step ID override")
-    args, _unknown = parser.parse_known_args()
+    parser.add_argument("--deadline", type=float, default=DEFAULT_DEADLINE_SEC,
+                        help=f"Shared time budget in seconds for renders (default: {DEFAULT_DEADLINE_SEC})")
+    parser.add_argument("--serve", action="store_true",
+                        help="Run as a daemon on a Unix socket; one round per request")
+    parser.add_argument("--socket", type=str, default=str(DEFAULT_SOCKET_PATH),
+                        help="Socket path for --serve (default: ops/.hook.sock)")
+    return parser
+
+
+def _request_argv(req: dict) -> list[str]:
+    """Map request keys (e.g. strict_clean=true, deadline=120) to CLI flags."""
+    argv: list[str] = []
+    for key, val in req.items():
+        if key in ("cmd", "serve", "socket") or val is None or val is False:
+            continue
+        flag = "--" + key.replace("_", "-")
+        if val is True:
+            argv.append(flag)
+        else:
+            argv.extend([flag, str(val)])
+    return argv
+
+
+def _handle_request(raw: bytes, parser: argparse.ArgumentParser) -> dict | None:
+    """Reply for one request line; None for shutdown. Never raises, so a bad
+    request (or a failing round) cannot take the server down."""
+    try:
+        req = json.loads(raw)
+        if not isinstance(req, dict):
+            raise ValueError("request must be a JSON object")
+    except ValueError as e:
+        return {"error": f"bad request: {e}"}
+    cmd = req.get("cmd", "run_end")
+    if cmd == "shutdown":
+        return None
+    if cmd != "run_end":
+        return {"error": f"unknown cmd: {cmd}"}
+    buf = io.StringIO()
+    try:
+        # argparse reports bad values on stderr and raises SystemExit
+        with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+            args, _unknown = parser.parse_known_args(_request_argv(req))
+    except SystemExit:
+        return {"error": "bad request: invalid arguments", "output": buf.getvalue()}
+    try:
+        with contextlib.redirect_stdout(buf):
+            exit_code, warnings = _do_round(args)
+    except (SystemExit, Exception) as e:
+        return {"error": f"round failed: {e!r}", "output": buf.getvalue()}
+    return {"exit_code": exit_code, "warnings": warnings, "output": buf.getvalue()}
+
+
+def _serve(sock_path: Path, parser: argparse.ArgumentParser) -> int:
+    """Serve run-end rounds over a Unix domain socket until a shutdown request."""
+    if not hasattr(socket, "AF_UNIX"):
+        print("[serve] ERROR: Unix domain sockets not supported on this platform")
+        return 2
+    try:
+        sock_path.unlink()
+    except FileNotFoundError:
+        pass
+    srv = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        srv.bind(str(sock_path))
+        srv.listen(1)
+        print(f"[serve] listening on {sock_path}")
+        running = True
+        while running:
+            conn, _ = srv.accept()
+            try:
+                with conn, conn.makefile("rwb") as f:
+                    for raw in f:
+                        if not raw.strip():
+                            continue
+                        resp = _handle_request(raw, parser)
+                        if resp is None:
+                            resp = {"ok": True}
+                            running = False
+                        f.write(json.dumps(resp, ensure_ascii=False).encode("utf-8") + b"\n")
+                        f.flush()
+                        if not running:
+                            break
+            except OSError as e:
+                # Client went away mid-request; keep serving
+                print(f"[serve] connection error: {e}")
+    finally:
+        srv.close()
+        try:
+            sock_path.unlink()
+        except FileNotFoundError:
+            pass
+    return 0
 
+
+def _do_round(args: argparse.Namespace) -> tuple[int, int]:
+    """One run-end round. Returns (exit_code, warnings)."""
     strict = args.strict_clean
     pre_status = "clean"
 
     # ── Pre-check (Round 10) ─────────────────────────────────────────
-    if strict:
+    # Fast path: only pay for git status --porcelain when the tree may be dirty
+    if strict and not _git_is_clean_fast(REPO_ROOT):
         out, err = _git_status_porcelain(REPO_ROOT)
         if err is not None:
             print(f"[STRICT_CLEAN] pre-check ERROR: {err}")
-            return 1
+            return 1, 0
         if not _is_clean(out):
             pre_status = "dirty"
             if args.allow_pre_dirty:
@@ -212,7 +378,7 @@ def main() -> int:
             else:
                 print("[STRICT_CLEAN] pre=dirty policy=FAIL")
                 print(_dirty_files_summary(out))
-                return 1
+                return 1, 0
         else:
             pre_status = "clean"
 
@@ -247,7 +413,8 @@ def main() -> int:
         ]
         if step_missing:
             cmd.extend(["--gate-code", "STEP_ID_MISSING"])
-        r = subprocess.run(cmd, capture_output=True, text=True, cwd=str(REPO_ROOT))
+        r = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                           cwd=str(REPO_ROOT))
         if r.returncode != 0:
             warnings += 1
 
@@ -257,9 +424,21 @@ def main() -> int:
         print(f"[B2 unlock] warning: {e}")
         warnings += 1
 
+    deadline = time.monotonic() + args.deadline
     for script in ("render_work_briefs.py", "render_status.py"):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            print(f"[render] {script}: deadline exceeded (skipped)")
+            warnings += 1
+            continue
         cmd = [sys.executable, str(REPO_ROOT / "tools" / script)]
-        r = subprocess.run(cmd, capture_output=True, text=True, cwd=str(REPO_ROOT))
+        try:
+            r = subprocess.run(cmd, capture_output=True, text=True, cwd=str(REPO_ROOT),
+                               timeout=min(remaining, RENDER_TIMEOUT_SEC))
+        except subprocess.TimeoutExpired:
+            print(f"[render] {script}: timeout")
+            warnings += 1
+            continue
         if r.returncode != 0:
             warnings += 1
 
@@ -274,16 +453,24 @@ def main() -> int:
         out, err = _git_status_porcelain(REPO_ROOT)
         if err is not None:
             print(f"[STRICT_CLEAN] post-check ERROR: {err}")
-            return 1
+            return 1, warnings
         post_clean = _is_clean(out)
         post_status = "clean" if post_clean else "dirty"
         policy = "FAIL" if not post_clean else ("WARN" if pre_status == "dirty" else "PASS")
         print(f"[STRICT_CLEAN] pre={pre_status} post={post_status} policy={policy}")
         if not post_clean:
             print(_dirty_files_summary(out))
-            return 1
+            return 1, warnings
 
-    return 0
+    return 0, warnings
+
+
+def main() -> int:
+    parser = _build_parser()
+    args, _unknown = parser.parse_known_args()
+    if args.serve:
+        return _serve(Path(args.socket), parser)
+    return _do_round(args)[0]
 
 
 if __name__ == "__main__":
@@ -9,25 +9,46 @@ Options (composable):
   --restore-generated   Restores ops/STATUS.md and removes .tmp_pr_body.txt after the loop.
   --strict-clean        FAIL if working tree is dirty at start or end.
   --allow-pre-dirty     With --strict-clean: downgrade pre-dirty to WARN (post-dirty still FAIL).
+  --deadline SECS       Shared wall-clock budget for all tools (default 600; each tool <= 180s).
 
 Exit codes: 0 = PASS/WARN, 1 = FAIL
 """
 from __future__ import annotations
 
 import argparse
+import functools
+import itertools
 import json
 import os
+import shutil
 import subprocess
 import sys
+import threading
+import time
+from collections import Counter, deque
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
 # ── Constants ────────────────────────────────────────────────────────
 
 PASS = "PASS"
 WARN = "WARN"
 FAIL = "FAIL"
 
+# git executable, resolved once (avoids a PATH/PATHEXT search per spawn)
+_GIT = shutil.which("git") or "git"
+
+_RANK = {PASS: 0, WARN: 1, FAIL: 2}
+
 CORE_TOOLS = {
     "doctor": "tools/ops/doctor.py",
     "next_step": "tools/agent/next_step.py",
@@ -45,22 +66,37 @@ VALIDATORS = {
     "fitting": "tools/validate/validate_u1_fitting.py",
 }
 
+# Per-tool timeout cap and default shared budget for the whole loop (seconds)
+TOOL_TIMEOUT_SEC = 180
+DEFAULT_DEADLINE_SEC = 600
+
+# Captured output bounds per stream (head lines kept + tail lines kept)
+CAPTURE_HEAD_LINES = 40
+CAPTURE_TAIL_LINES = 20
+
+# How long to wait for output drain threads after killing a timed-out tool
+KILL_DRAIN_TIMEOUT_SEC = 0.5
+
 
 class ToolResult:
     """Result of a single tool execution."""
-    __slots__ = ("tool_name", "exit_code", "stdout", "stderr", "severity")
+    __slots__ = ("tool_name", "exit_code", "stdout", "stderr", "first_line",
+                 "severity", "_lines")
 
     def __init__(self, tool_name: str, exit_code: int, stdout: str, stderr: str):
         self.tool_name = tool_name
         self.exit_code = exit_code
         self.stdout = stdout
         self.stderr = stderr
+        nl = stdout.find("\n")
+        self.first_line = stdout[:nl] if nl >= 0 else stdout
+        self._lines: Optional[List[str]] = None
         self.severity = self._compute_severity()
 
     def _compute_severity(self) -> str:
         if self.exit_code == 0:
             # Check first line for SUMMARY indicators
-            first_line = self.stdout.split("\n")[0] if self.stdout else ""
+            first_line = self.first_line
             if "SUMMARY:" in first_line:
                 if "FAIL" in first_line:
                     return FAIL
@@ -78,6 +114,12 @@ class ToolResult:
         else:
             return FAIL
 
+    def lines(self) -> List[str]:
+        """stdout split into lines (computed once, cached)."""
+        if self._lines is None:
+            self._lines = self.stdout.splitlines()
+        return self._lines
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "tool_name": self.tool_name,
@@ -90,11 +132,10 @@ class ToolResult:
 
 # ── Repo root detection ──────────────────────────────────────────────
 
-def find_repo_root(start_dir: Optional[Path] = None) -> Optional[Path]:
-    """Find repository root by walking up until .git/ or project_map.md."""
-    if start_dir is None:
-        start_dir = Path.cwd()
-    current = start_dir.resolve()
+@functools.lru_cache(maxsize=16)
+def _repo_root_from(start: Path) -> Optional[Path]:
+    """Walk up from resolved *start*; memoized so repeated lookups skip the stat walk."""
+    current = start
     while True:
         if (current / ".git").is_dir():
             return current
@@ -106,31 +147,101 @@ def find_repo_root(start_dir: Optional[Path] = None) -> Optional[Path]:
         current = parent
 
 
+def find_repo_root(start_dir: Optional[Path] = None) -> Optional[Path]:
+    """Find repository root by walking up until .git/ or project_map.md."""
+    if start_dir is None:
+        start_dir = Path.cwd()
+    return _repo_root_from(start_dir.resolve())
+
+
 # ── Tool execution ───────────────────────────────────────────────────
 
-def run_tool(repo_root: Path, tool_path: str, args: List[str]) -> ToolResult:
-    """Execute a tool and capture result."""
+class _BoundedCapture:
+    """Keep the first `head` and last `tail` lines of a stream; count the rest.
+
+    Omitted lines are not stored, but a FAIL/WARN token seen in them is
+    recorded on the elision line so the stdout severity fallback still fires.
+    """
+
+    def __init__(self, head: int = CAPTURE_HEAD_LINES, tail: int = CAPTURE_TAIL_LINES):
+        self._head_max = head
+        self.head: List[str] = []
+        self.tail: deque = deque(maxlen=tail)
+        self.omitted = 0
+        self.omitted_marker = ""
+
+    def feed(self, line: str) -> None:
+        if len(self.head) < self._head_max:
+            self.head.append(line)
+            return
+        if len(self.tail) == self.tail.maxlen:
+            dropped = self.tail[0]
+            self.omitted += 1
+            if self.omitted_marker != FAIL:
+                if FAIL in dropped:
+                    self.omitted_marker = FAIL
+                elif WARN in dropped:
+                    self.omitted_marker = WARN
+        self.tail.append(line)
+
+    def text(self) -> str:
+        lines = list(self.head)
+        if self.omitted:
+            seen = f", {self.omitted_marker} seen" if self.omitted_marker else ""
+            lines.append(f"... ({self.omitted} lines omitted{seen})")
+        lines.extend(self.tail)
+        return "\n".join(lines)
+
+
+def _drain(stream, capture: _BoundedCapture) -> None:
+    for line in stream:
+        capture.feed(line.rstrip("\r\n"))
+    stream.close()
+
+
+def run_tool(repo_root: Path, tool_path: str, args: List[str],
+             timeout: float = TOOL_TIMEOUT_SEC) -> ToolResult:
+    """Execute a tool and capture result (stdout/stderr bounded to head+tail lines)."""
     full_path = repo_root / tool_path
     if not full_path.is_file():
         return ToolResult(tool_path, 1, "", f"File not found: {full_path}")
 
     cmd = [sys.executable, str(full_path)] + args
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             cmd,
             cwd=str(repo_root),
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
             encoding="utf-8",
             errors="replace",
-            timeout=180,
+            bufsize=1,
         )
-        return ToolResult(tool_path, result.returncode, result.stdout, result.stderr)
-    except subprocess.TimeoutExpired:
-        return ToolResult(tool_path, 1, "", "Timeout (>180s)")
     except Exception as exc:
         return ToolResult(tool_path, 1, "", f"Execution error: {exc}")
 
+    out_cap, err_cap = _BoundedCapture(), _BoundedCapture()
+    readers = [
+        threading.Thread(target=_drain, args=(proc.stdout, out_cap), daemon=True),
+        threading.Thread(target=_drain, args=(proc.stderr, err_cap), daemon=True),
+    ]
+    for t in readers:
+        t.start()
+    try:
+        returncode = proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        # A grandchild may still hold the pipes open; the drain threads are
+        # daemons, so give them a moment and then abandon them.
+        for t in readers:
+            t.join(timeout=KILL_DRAIN_TIMEOUT_SEC)
+        return ToolResult(tool_path, 1, "", f"Timeout (>{timeout:.0f}s)")
+    for t in readers:
+        t.join()
+    return ToolResult(tool_path, returncode, out_cap.text(), err_cap.text())
+
 
 # ── Output formatting ────────────────────────────────────────────────
 
@@ -141,17 +252,24 @@ def _safe_print(text: str = "") -> None:
         print(text.encode("ascii", errors="replace").decode("ascii"))
 
 
+def _write_json(obj: Any) -> None:
+    """Write obj as indented UTF-8 JSON straight to the stdout byte buffer."""
+    data = _dumps(obj)
+    buf = getattr(sys.stdout, "buffer", None)
+    if buf is None:
+        _safe_print(data.decode("utf-8"))
+        return
+    sys.stdout.flush()
+    buf.write(data)
+    buf.write(b"\n")
+    buf.flush()
+
+
 def print_summary(results: List[ToolResult], mode: str, *,
                   json_output: bool = False) -> int:
     """Print summary and return exit code."""
-    worst = PASS
-    counts = {PASS: 0, WARN: 0, FAIL: 0}
-    for r in results:
-        counts[r.severity] = counts.get(r.severity, 0) + 1
-        rank = {PASS: 0, WARN: 1, FAIL: 2}.get(r.severity, 0)
-        worst_rank = {PASS: 0, WARN: 1, FAIL: 2}.get(worst, 0)
-        if rank > worst_rank:
-            worst = r.severity
+    counts = Counter(r.severity for r in results)
+    worst = max(counts, key=_RANK.__getitem__, default=PASS)
 
     if json_output:
         out = {
@@ -159,7 +277,7 @@ def print_summary(results: List[ToolResult], mode: str, *,
             "mode": mode,
             "tools_run": [r.to_dict() for r in results],
         }
-        _safe_print(json.dumps(out, indent=2, ensure_ascii=False))
+        _write_json(out)
         return 1 if worst == FAIL else 0
 
     # Human-readable
@@ -175,10 +293,10 @@ def print_summary(results: List[ToolResult], mode: str, *,
     for r in results:
         _safe_print(f"-- {r.tool_name} [{r.severity}] --")
         # Print first 20 lines of stdout
-        lines = r.stdout.split("\n")[:20]
-        for line in lines:
+        lines = r.lines()
+        for line in lines[:20]:
             _safe_print(f"  {line}")
-        if len(r.stdout.split("\n")) > 20:
+        if len(lines) > 20:
             _safe_print("  ...")
         if r.stderr:
             _safe_print(f"  [stderr]: {r.stderr[:200]}")
@@ -201,7 +319,7 @@ def _git_status_porcelain(repo_root: Path) -> Tuple[Optional[str], Optional[str]
     On success error_msg is None; on failure stdout is None."""
     try:
         r = subprocess.run(
-            ["git", "status", "--porcelain"],
+            [_GIT, "status", "--porcelain"],
             cwd=str(repo_root),
             capture_output=True, text=True,
             encoding="utf-8", errors="replace",
@@ -216,16 +334,43 @@ def _git_status_porcelain(repo_root: Path) -> Tuple[Optional[str], Optional[str]
         return None, str(exc)
 
 
+def _git_is_clean_fast(repo_root: Path) -> Optional[bool]:
+    """Cheap clean check: no tracked changes vs HEAD and no untracked files.
+    Returns True/False, or None if git could not answer (caller falls back)."""
+    try:
+        r = subprocess.run(
+            [_GIT, "diff-index", "--quiet", "HEAD", "--"],
+            cwd=str(repo_root),
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            timeout=15,
+        )
+        if r.returncode == 1:
+            return False
+        if r.returncode != 0:
+            return None
+        r = subprocess.run(
+            [_GIT, "ls-files", "--others", "--exclude-standard"],
+            cwd=str(repo_root),
+            capture_output=True, timeout=15,
+        )
+        if r.returncode != 0:
+            return None
+        return not r.stdout.strip()
+    except Exception:
+        return None
+
+
 def _is_clean(porcelain_output: str) -> bool:
     return porcelain_output.strip() == ""
 
 
 def _dirty_files_summary(porcelain_output: str, max_lines: int = 20) -> str:
-    lines = [l for l in porcelain_output.strip().splitlines() if l.strip()]
-    shown = lines[:max_lines]
+    it = (l for l in porcelain_output.splitlines() if l.strip())
+    shown = list(itertools.islice(it, max_lines))
+    rest = sum(1 for _ in it)
     text = "\n".join(f"    {l}" for l in shown)
-    if len(lines) > max_lines:
-        text += f"\n    ... ({len(lines) - max_lines} more)"
+    if rest:
+        text += f"\n    ... ({rest} more)"
     return text
 
 
@@ -257,9 +402,10 @@ def _cleanup_generated(repo_root: Path, *, json_output: bool = False) -> None:
             continue
         try:
             r = subprocess.run(
-                ["git", "restore", rel_path],
+                [_GIT, "restore", rel_path],
                 cwd=str(repo_root),
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=15,
             )
@@ -315,6 +461,8 @@ def main(argv: Optional[List[str]] = None) -> int:
                         help="FAIL if working tree dirty at start or end (Round 10)")
     parser.add_argument("--allow-pre-dirty", action="store_true",
                         help="With --strict-clean: downgrade pre-dirty to WARN (Round 10)")
+    parser.add_argument("--deadline", type=float, default=DEFAULT_DEADLINE_SEC,
+                        help=f"Shared time budget in seconds for all tools (default: {DEFAULT_DEADLINE_SEC})")
     parser.add_argument("--json", dest="json_output", action="store_true",
                         help="Output structured JSON")
     args = parser.parse_args(argv)
@@ -329,7 +477,8 @@ def main(argv: Optional[List[str]] = None) -> int:
     strict = args.strict_clean
     pre_status = "clean"  # default for reporting when strict is OFF
 
-    if strict:
+    # Fast path: only pay for git status --porcelain when the tree may be dirty
+    if strict and not _git_is_clean_fast(repo_root):
         out, err = _git_status_porcelain(repo_root)
         if err is not None:
             # git failed → cannot guarantee cleanliness
@@ -352,14 +501,22 @@ def main(argv: Optional[List[str]] = None) -> int:
             pre_status = "clean"
 
     results: List[ToolResult] = []
+    deadline = time.monotonic() + args.deadline
+
+    def _run(tool_path: str, tool_args: List[str]) -> ToolResult:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return ToolResult(tool_path, 1, "", "deadline exceeded")
+        return run_tool(repo_root, tool_path, tool_args,
+                        timeout=min(remaining, TOOL_TIMEOUT_SEC))
 
     # 1. Doctor (always)
-    results.append(run_tool(repo_root, CORE_TOOLS["doctor"], []))
+    results.append(_run(CORE_TOOLS["doctor"], []))
 
     # 2. Mode-specific tools
     if args.mode == "full":
         # U2 smokes
-        results.append(run_tool(repo_root, CORE_TOOLS["u2_smokes"], []))
+        results.append(_run(CORE_TOOLS["u2_smokes"], []))
 
         # U1 validators (if run-dir provided)
         if args.run_dir:
@@ -370,8 +527,8 @@ def main(argv: Optional[List[str]] = None) -> int:
             for module, validator_path in VALIDATORS.items():
                 validator_full = repo_root / validator_path
                 if validator_full.is_file():
-                    results.append(run_tool(repo_root, validator_path,
-                                           ["--run-dir", str(run_dir_path)]))
+                    results.append(_run(validator_path,
+                                        ["--run-dir", str(run_dir_path)]))
 
     # 3. Next step (always)
     next_step_args = [
@@ -379,7 +536,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         "--top", str(args.top),
         "--plan", args.plan,
     ]
-    results.append(run_tool(repo_root, CORE_TOOLS["next_step"], next_step_args))
+    results.append(_run(CORE_TOOLS["next_step"], next_step_args))
 
     # 4. Render (if not skipped and mode=full)
     if not args.skip_render:
@@ -387,14 +544,14 @@ def main(argv: Optional[List[str]] = None) -> int:
             # render_work_briefs (optional)
             briefs_path = OPTIONAL_TOOLS["render_work_briefs"]
             if (repo_root / briefs_path).is_file():
-                results.append(run_tool(repo_root, briefs_path, []))
+                results.append(_run(briefs_path, []))
             else:
                 results.append(ToolResult(briefs_path, 0, "[SKIP] Not found", ""))
 
         # render_status (both modes)
         status_path = OPTIONAL_TOOLS["render_status"]
         if (repo_root / status_path).is_file():
-            results.append(run_tool(repo_root, status_path, []))
+            results.append(_run(status_path, []))
         else:
             results.append(ToolResult(status_path, 0, "[SKIP] Not found", ""))
 
@@ -7,9 +7,18 @@ exports/runs/<lane>/<run_id>/ paths, appends deduplicated records.
 from __future__ import annotations
 
 import json
+import mmap
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 REPO_ROOT = Path(__file__).resolve().parents[2]
 RUN_REGISTRY = REPO_ROOT / "ops" / "run_registry.jsonl"
 LAB_ROOTS_PATH = REPO_ROOT / "ops" / "lab_roots.local.json"
@@ -17,12 +26,15 @@ MAX_LINES_READ = 200
 DEDUP_LOOKBACK = 1000
 
 RUNS_PATTERN = re.compile(r"exports/runs/([^/]+)/([^/]+)(?:/|$)")
+_runs_search = RUNS_PATTERN.search
 
 
 def _extract_lane_run_id(path: str) -> tuple[str, str] | None:
     """Extract (lane, run_id) from path matching exports/runs/<lane>/<run_id>/."""
-    norm = path.replace("\\", "/")
-    m = RUNS_PATTERN.search(norm)
+    # Paths from _get_paths_from_event are already forward-slashed; only copy when needed
+    if "\\" in path:
+        path = path.replace("\\", "/")
+    m = _runs_search(path)
     if m:
         return (m.group(1), m.group(2))
     return None
@@ -49,70 +61,180 @@ def _is_round_end(ev: dict) -> bool:
     return str(et).lower() == "round_end"
 
 
+def _tail_lines(path: Path, n: int) -> list[str]:
+    """Return the last n non-empty lines of path, scanning an mmap of the file backward from EOF."""
+    out: list[bytes] = []
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = len(mm)
+            while end > 0 and len(out) < n:
+                start = mm.rfind(b"\n", 0, end) + 1
+                raw = mm[start:end].strip()
+                if raw:
+                    out.append(raw)
+                end = start - 1
+    out.reverse()
+    return [raw.decode("utf-8") for raw in out]
+
+
 def _read_last_n_lines(path: Path, n: int) -> list[str]:
-    """Read last n non-empty lines from file."""
-    if not path.exists():
-        return []
-    lines = []
+    """Read last n non-empty lines from file ([] if missing or unreadable)."""
     try:
-        with open(path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    lines.append(line)
+        return _tail_lines(path, n)
     except Exception:
         return []
-    return lines[-n:] if len(lines) > n else lines
+
+
+def _run_evidence(ev: dict) -> tuple[str | None, str | None, list[str]]:
+    """Return (lane, run_id, evidence_paths) from the first <=3 distinct exports/runs paths of an event."""
+    lane, run_id = None, None
+    evidence_paths = []
+    # The same path often appears under several keys (evidence + artifacts_touched)
+    for p in dict.fromkeys(_get_paths_from_event(ev)):
+        extracted = _extract_lane_run_id(p)
+        if extracted:
+            lane, run_id = extracted
+            evidence_paths.append(p)
+            if len(evidence_paths) >= 3:
+                break
+    return lane, run_id, evidence_paths
 
 
 def _read_round_end_events(lab_root: Path, module: str) -> list[dict]:
-    """Read last N lines, parse JSON, return ROUND_END events for module."""
+    """Read last N lines, return ROUND_END events for module (oldest first)."""
     log_path = lab_root / "exports" / "progress" / "PROGRESS_LOG.jsonl"
     raw_lines = _read_last_n_lines(log_path, MAX_LINES_READ)
     events = []
     mod_lower = module.lower()
     for line in raw_lines:
         try:
-            ev = json.loads(line)
-            if ev.get("module", "").lower() == mod_lower and _is_round_end(ev):
-                events.append(ev)
+            ev = _loads(line)
         except json.JSONDecodeError:
             continue
+        if ev.get("module", "").lower() == mod_lower and _is_round_end(ev):
+            events.append(ev)
     return events
 
 
-def _get_existing_keys(registry_path: Path) -> set[tuple[str, str, str, str]]:
-    """Read last DEDUP_LOOKBACK lines, return set of (module, lane, run_id, round_id)."""
-    if not registry_path.exists():
-        return set()
-    lines = []
-    try:
-        with open(registry_path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    lines.append(line)
-    except Exception:
-        return set()
-    lines = lines[-DEDUP_LOOKBACK:]
-    keys = set()
-    for line in lines:
+def _index_path(registry_path: Path) -> Path:
+    """Dedup key sidecar next to the registry (run_registry.jsonl -> run_registry.idx)."""
+    return registry_path.with_suffix(".idx")
+
+
+_INDEX_HEADER_RE = re.compile(rb"# registry_size=(\d{20})\n")
+
+
+def _index_header(registry_size: int) -> bytes:
+    """Fixed-width first line of the sidecar, so it can be rewritten in place after an append."""
+    return f"# registry_size={registry_size:020d}\n".encode("ascii")
+
+
+def _index_line(key: tuple[str, str, str, str]) -> str:
+    # JSON array: lane/run_id may contain any character, including separators
+    return json.dumps(list(key), ensure_ascii=False) + "\n"
+
+
+def _index_registry_size(first_line: bytes) -> int | None:
+    m = _INDEX_HEADER_RE.fullmatch(first_line)
+    return int(m.group(1)) if m else None
+
+
+def _parse_registry_keys(registry_path: Path) -> list[tuple[str, str, str, str]]:
+    """Parse last DEDUP_LOOKBACK registry records into (module, lane, run_id, round_id), oldest first."""
+    keys = []
+    for line in _read_last_n_lines(registry_path, DEDUP_LOOKBACK):
         try:
-            rec = json.loads(line)
+            rec = _loads(line)
             mod = (rec.get("module") or "").strip()
             lane = (rec.get("lane") or "").strip()
             run_id = (rec.get("run_id") or "").strip()
             round_id = (rec.get("round_id") or "").strip()
-            keys.add((mod, lane, run_id, round_id))
+            keys.append((mod, lane, run_id, round_id))
         except json.JSONDecodeError:
             continue
     return keys
 
 
+def _write_index(idx_path: Path, data: bytes) -> None:
+    """Replace the sidecar atomically (tmp + rename), so readers never see a truncated one."""
+    tmp_path = idx_path.parent / f"{idx_path.name}.tmp.{os.getpid()}"
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, idx_path)
+    except OSError:
+        try:
+            tmp_path.unlink(missing_ok=True)  # don't leave a stray tmp next to the sidecar
+        except OSError:
+            pass
+        raise
+
+
+def _get_existing_keys(registry_path: Path) -> set[tuple[str, str, str, str]]:
+    """Return set of (module, lane, run_id, round_id) for the last DEDUP_LOOKBACK records.
+
+    Keys come from the run_registry.idx sidecar (one JSON array per line after a header recording
+    the registry size it covers). The sidecar is trusted only when that size still matches the
+    registry and it is not older than it; otherwise it is rebuilt from the registry tail.
+    """
+    try:
+        registry_st = registry_path.stat()
+    except OSError:
+        return set()
+    idx_path = _index_path(registry_path)
+    try:
+        with open(idx_path, "rb") as f:
+            fresh = (
+                _index_registry_size(f.readline()) == registry_st.st_size
+                and os.fstat(f.fileno()).st_mtime_ns >= registry_st.st_mtime_ns
+            )
+    except OSError:
+        fresh = False
+    if fresh:
+        keys = set()
+        for line in _read_last_n_lines(idx_path, DEDUP_LOOKBACK):
+            if line.startswith("#"):
+                continue
+            try:
+                parts = _loads(line)
+            except ValueError:
+                continue
+            if isinstance(parts, list) and len(parts) == 4:
+                keys.add(tuple(parts))
+        return keys
+    parsed = _parse_registry_keys(registry_path)
+    try:
+        body = "".join(_index_line(k) for k in parsed).encode("utf-8")
+        _write_index(idx_path, _index_header(registry_st.st_size) + body)
+    except OSError:
+        pass
+    return set(parsed)
+
+
+def _append_index(registry_path: Path, prev_size: int, key_lines: list[str]) -> None:
+    """Append keys to the sidecar and bump its header, if it covered the registry before the append.
+
+    A sidecar that was already out of date is left alone; the size check rebuilds it next run.
+    """
+    idx_path = _index_path(registry_path)
+    size = registry_path.stat().st_size
+    body = "".join(key_lines).encode("utf-8")
+    try:
+        with open(idx_path, "r+b") as f:
+            if _index_registry_size(f.readline()) != prev_size:
+                return
+            f.seek(0, os.SEEK_END)
+            f.write(body)
+            f.seek(0)
+            f.write(_index_header(size))
+    except FileNotFoundError:
+        if prev_size == 0:
+            _write_index(idx_path, _index_header(size) + body)
+
+
 def _get_lab_roots() -> list[tuple[Path, str]]:
     """Return [(lab_root, module), ...] for body, fitting, garment."""
-    import os
-
     roots = []
     # Body: main repo
     body_progress = REPO_ROOT / "exports" / "progress" / "PROGRESS_LOG.jsonl"
@@ -120,12 +242,10 @@ def _get_lab_roots() -> list[tuple[Path, str]]:
         roots.append((REPO_ROOT, "body"))
     # Fitting, Garment: ENV > lab_roots.local.json
     cfg = {}
-    if LAB_ROOTS_PATH.exists():
-        try:
-            with open(LAB_ROOTS_PATH, encoding="utf-8") as f:
-                cfg = json.load(f)
-        except Exception:
-            pass
+    try:
+        cfg = _loads(LAB_ROOTS_PATH.read_bytes())
+    except Exception:
+        pass
     for env_key, mod in [("FITTING_LAB_ROOT", "fitting"), ("GARMENT_LAB_ROOT", "garment")]:
         val = os.environ.get(env_key, "").strip() or (cfg.get(env_key) or "").strip()
         if val:
@@ -142,19 +262,17 @@ def _get_lab_roots() -> list[tuple[Path, str]]:
 def main() -> int:
     existing = _get_existing_keys(RUN_REGISTRY)
     appended = 0
+    new_records: list[str] = []
+    new_keys: list[str] = []
 
-    for lab_root, module in _get_lab_roots():
-        for ev in _read_round_end_events(lab_root, module):
-            paths = _get_paths_from_event(ev)
-            lane, run_id = None, None
-            evidence_paths = []
-            for p in paths:
-                extracted = _extract_lane_run_id(p)
-                if extracted:
-                    lane, run_id = extracted
-                    evidence_paths.append(p)
-                    if len(evidence_paths) >= 3:
-                        break
+    # Lab logs are independent files: read their tails concurrently, then register in root order
+    roots = _get_lab_roots()
+    with ThreadPoolExecutor(max_workers=max(1, len(roots))) as ex:
+        batches = list(ex.map(lambda r: _read_round_end_events(r[0], r[1]), roots))
+
+    for (_, module), events in zip(roots, batches):
+        for ev in events:
+            lane, run_id, evidence_paths = _run_evidence(ev)
             if not lane or not run_id:
                 continue
             round_id_raw = (ev.get("round_id") or "").strip()
@@ -175,9 +293,9 @@ def main() -> int:
             manifest_path = None
             manifest_match_prefix = False
             for ep in evidence_paths:
-                norm_ep = ep.replace("\\", "/")
-                if "manifest" in norm_ep.lower() or "geometry_manifest" in norm_ep:
-                    if norm_ep.startswith(run_prefix):
+                # evidence_paths come from _get_paths_from_event, already forward-slashed
+                if "manifest" in ep.lower() or "geometry_manifest" in ep:
+                    if ep.startswith(run_prefix):
                         manifest_path = ep
                         manifest_match_prefix = True
                         break
@@ -199,13 +317,20 @@ def main() -> int:
             }
             if manifest_path:
                 rec["manifest_path"] = manifest_path
-            try:
-                RUN_REGISTRY.parent.mkdir(parents=True, exist_ok=True)
-                with open(RUN_REGISTRY, "a", encoding="utf-8") as f:
-                    f.write(json.dumps(rec, ensure_ascii=False) + "\n")
-                appended += 1
-            except Exception:
-                pass
+            new_records.append(json.dumps(rec, ensure_ascii=False) + "\n")
+            new_keys.append(_index_line(key))
+
+    # One append per file for the whole batch; the sidecar follows the registry
+    if new_records:
+        try:
+            RUN_REGISTRY.parent.mkdir(parents=True, exist_ok=True)
+            with open(RUN_REGISTRY, "a", encoding="utf-8") as f:
+                prev_size = os.fstat(f.fileno()).st_size
+                f.write("".join(new_records))
+            appended = len(new_records)
+            _append_index(RUN_REGISTRY, prev_size, new_keys)
+        except Exception:
+            pass
 
     print(f"update_run_registry: appended={appended}")
     return 0
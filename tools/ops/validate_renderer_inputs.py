@@ -6,12 +6,25 @@ Outputs: stdout summary of warnings; optionally ops/hub_state_v1.json diagnostic
 """
 from __future__ import annotations
 
+import functools
 import json
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+try:
+    import jsonschema
+except ImportError:
+    jsonschema = None  # manual minimal validation below
+
 REPO_ROOT = Path(__file__).resolve().parents[2]
 LAB_ROOTS_PATH = REPO_ROOT / "ops" / "lab_roots.local.json"
 SCHEMA_PATH = REPO_ROOT / "contracts" / "progress_event_v1.schema.json"
@@ -19,8 +32,11 @@ MASTER_PLAN_PATH = REPO_ROOT / "contracts" / "master_plan_v1.json"
 HUB_STATE_PATH = REPO_ROOT / "ops" / "hub_state_v1.json"
 
 MODULES = ("body", "fitting", "garment")
+_MODULE_SET = frozenset(MODULES)
 BRIEF_NAMES = ("BODY_WORK_BRIEF.md", "FITTING_WORK_BRIEF.md", "GARMENT_WORK_BRIEF.md")
 MAX_LINES = 100
+TAIL_READ_BYTES = 256 * 1024
+_TOMBSTONE_RE = re.compile(r"referenced_line=([\d/]+)")
 
 
 def _warn(code: str, message: str, path: str = "N/A") -> str:
@@ -54,7 +70,9 @@ def _get_lab_roots() -> dict[str, Path | None]:
     return roots
 
 
+@functools.lru_cache(maxsize=1)
 def _load_schema() -> dict | None:
+    """Progress event schema, parsed once per process (shared by every module's log)."""
     if not SCHEMA_PATH.exists():
         return None
     try:
@@ -64,16 +82,26 @@ def _load_schema() -> dict | None:
         return None
 
 
-def _collect_tombstone_exempt_lines(lines: list[str], log_path: Path) -> set[int]:
+@functools.lru_cache(maxsize=1)
+def _schema_validator():
+    """jsonschema validator built (and meta-schema checked) once, or None for the manual fallback."""
+    schema = _load_schema()
+    if not schema or jsonschema is None:
+        return None
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def _collect_tombstone_exempt_lines(lines: list[bytes], log_path: Path) -> set[int]:
     """Collect 1-indexed line numbers exempted by SCHEMA_VIOLATION_BACKFILLED tombstone events."""
     exempt: set[int] = set()
     for line in lines:
-        line = line.strip() if isinstance(line, str) else ""
         if not line:
             continue
         try:
-            ev = json.loads(line)
-        except json.JSONDecodeError:
+            ev = _loads(line)
+        except ValueError:  # JSONDecodeError, or UnicodeDecodeError from stdlib json on bytes
             continue
         gc = ev.get("gate_codes") or ev.get("gate_code")
         if isinstance(gc, str):
@@ -81,14 +109,31 @@ def _collect_tombstone_exempt_lines(lines: list[str], log_path: Path) -> set[int
         if not isinstance(gc, list) or "SCHEMA_VIOLATION_BACKFILLED" not in gc:
             continue
         note = str(ev.get("note") or "")
-        m = re.search(r"referenced_line=([\d/]+)", note)
+        m = _TOMBSTONE_RE.search(note)
         if m:
+            # group is [\d/]+ only, so split parts need no strip
             for part in m.group(1).split("/"):
-                if part.strip().isdigit():
-                    exempt.add(int(part.strip()))
+                if part.isdigit():
+                    exempt.add(int(part))
     return exempt
 
 
+def _read_tail_lines(path: Path, n: int, window: int = TAIL_READ_BYTES) -> list[bytes]:
+    """Last n non-empty (stripped) lines of path, reading a bounded tail that doubles until n fit."""
+    with open(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        while True:
+            start = max(0, size - window)
+            f.seek(start)
+            parts = f.read(size - start).split(b"\n")
+            if start > 0:
+                parts = parts[1:]  # first piece may be a partial line
+            lines = [ln for ln in (raw.strip() for raw in parts) if ln]
+            if len(lines) >= n or start == 0:
+                return lines[-n:]
+            window *= 2
+
+
 def _validate_event_manual(ev: dict, line_no: int) -> list[str]:
     """Manual minimal validation when jsonschema unavailable."""
     warns = []
@@ -101,7 +146,7 @@ def _validate_event_manual(ev: dict, line_no: int) -> list[str]:
         warns.append(_warn("TS_INVALID", f"line {line_no}: ts must be string", "N/A"))
     if "module" not in ev:
         warns.append(_warn("MODULE_MISSING", f"line {line_no}: module required", "N/A"))
-    elif ev.get("module", "").lower() not in ("body", "fitting", "garment"):
+    elif str(ev.get("module") or "").lower() not in _MODULE_SET:
         warns.append(_warn("MODULE_INVALID", f"line {line_no}: module must be body|fitting|garment", "N/A"))
     if "step_id" not in ev:
         warns.append(_warn("STEP_ID_MISSING", f"line {line_no}: step_id required", "N/A"))
@@ -118,30 +163,27 @@ def _validate_progress_log(log_path: Path) -> tuple[list[str], int]:
         warns.append(_warn("PROGRESS_LOG_NOT_FOUND", "PROGRESS_LOG.jsonl not found", str(log_path)))
         return warns, 0
     try:
-        lines = log_path.read_text(encoding="utf-8", errors="replace").strip().splitlines()
+        # Raw bytes lines: the JSON parser does the UTF-8 decode, no text-mode codec pass
+        lines = _read_tail_lines(log_path, MAX_LINES)
     except Exception as e:
         warns.append(_warn("PROGRESS_LOG_READ_FAIL", str(e), str(log_path)))
         return warns, 0
-    lines = [ln.strip() for ln in lines if ln.strip()][-MAX_LINES:]
     exempt = _collect_tombstone_exempt_lines(lines, log_path)
-    schema = _load_schema()
+    validator = _schema_validator()
     for i, line in enumerate(lines):
         line_no = i + 1
         if line_no in exempt:
             exempted_count += 1
             continue
         try:
-            ev = json.loads(line)
-        except json.JSONDecodeError as e:
+            ev = _loads(line)
+        except ValueError as e:
             warns.append(_warn("PROGRESS_LOG_PARSE_FAIL", f"line {line_no}: {e}", str(log_path)))
             continue
-        if schema:
-            try:
-                import jsonschema
-                jsonschema.validate(ev, schema)
-            except ImportError:
-                warns.extend(_validate_event_manual(ev, line_no))
-            except jsonschema.ValidationError as e:
+        if validator is not None:
+            # Same single best error jsonschema.validate() would raise
+            e = jsonschema.exceptions.best_match(validator.iter_errors(ev))
+            if e is not None:
                 warns.append(_warn("SCHEMA_VIOLATION", f"line {line_no}: {e}", str(log_path)))
         else:
             warns.extend(_validate_event_manual(ev, line_no))
@@ -211,14 +253,17 @@ def main() -> int:
     warnings.extend(_validate_master_plan())
     warnings.extend(_validate_brief_files(roots))
 
+    log_paths = []
     for mod in MODULES:
         root = roots.get(mod)
         if root is None or not root.exists():
             continue
-        log_path = root / "exports" / "progress" / "PROGRESS_LOG.jsonl"
-        w, exempted = _validate_progress_log(log_path)
-        warnings.extend(w)
-        exempted_total += exempted
+        log_paths.append(root / "exports" / "progress" / "PROGRESS_LOG.jsonl")
+    # Independent per-lab logs; map() keeps results in MODULES order
+    with ThreadPoolExecutor(max_workers=max(1, len(log_paths))) as ex:
+        for w, exempted in ex.map(_validate_progress_log, log_paths):
+            warnings.extend(w)
+            exempted_total += exempted
 
     if not LAB_ROOTS_PATH.exists():
         warnings.append(_warn("LAB_ROOTS_MISSING", "ops/lab_roots.local.json not found (fitting/garment optional)", str(LAB_ROOTS_PATH)))
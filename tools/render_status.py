@@ -5,11 +5,25 @@ BODY: curated + geo runs. FITTING/GARMENT: external lab briefs (read-only).
 Exit 0 always; failures surface as Warnings.
 Atomic write, stable warnings, text normalization.
 """
+import fnmatch
+import functools
+import io
+import itertools
 import json
+import mmap
 import os
 import re
+import sys
+from collections import deque
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
+from typing import Iterator
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 
@@ -17,6 +31,10 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 PATH_PRIORITY = {"RUN_EVIDENCE": 0, "MANIFEST": 1, "OTHER": 2, "SAMPLE": 3}
 OPS_STATUS = REPO_ROOT / "ops" / "STATUS.md"
 LAB_ROOTS_PATH = REPO_ROOT / "ops" / "lab_roots.local.json"
+# Below this size a plain read beats setting up an mmap
+MMAP_MIN_BYTES = 1024 * 1024
+# Block size for backward PROGRESS_LOG tail reads
+TAIL_BLOCK_SIZE = 64 * 1024
 
 # Warning format: [CODE] message | path=<path or N/A> OR expected=<hint_path>
 def _warn(code: str, message: str, path: str = "N/A") -> str:
@@ -24,6 +42,28 @@ def _warn(code: str, message: str, path: str = "N/A") -> str:
     return f"[{code}] {message} | path={path}"
 
 
+# fromisoformat() accepts a trailing "Z" natively from 3.11; skip the per-event str.replace there
+_FROMISO_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+# Display timezone for Updated/brief_mtime; None (local time) without zoneinfo/tzdata
+try:
+    from zoneinfo import ZoneInfo
+    _TZ = ZoneInfo("Asia/Seoul")
+except (ImportError, KeyError):
+    _TZ = None
+
+
+def _parse_ts(ts) -> datetime | None:
+    """ISO-8601 event ts -> aware datetime (naive = UTC); None if missing/unparseable."""
+    try:
+        dt = datetime.fromisoformat(ts if _FROMISO_ACCEPTS_Z else ts.replace("Z", "+00:00"))
+    except Exception:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
 def _warn_dep(code: str, message: str, hint_path: str | None = None) -> str:
     """Format dependency warning: use expected=hint_path when hint_path given, else path=N/A."""
     if hint_path and hint_path.strip():
@@ -36,13 +76,18 @@ def _warn_m1(dep_id: str, hint_path: str, detail: str) -> str:
     return f"[M1_CHECK_FAILED] dependency | id={dep_id}; expected={hint_path}; detail={detail}"
 
 
+_WARN_SORT_RE = re.compile(r"\[([^\]]+)\].*\| (?:path|expected|id)=([^;]*)(?:;|$)")
+_WARN_CODE_RE = re.compile(r"\[([^\]]+)\]")
+_WIN_DRIVE_RE = re.compile(r"[A-Za-z]:")
+
+
 def _sort_warnings(warnings: list[str]) -> list[str]:
     """Sort by CODE then path/expected/id for stable diff."""
     def key(w: str) -> tuple:
-        m = re.match(r"\[([^\]]+)\].*\| (?:path|expected|id)=([^;]*)(?:;|$)", w)
+        m = _WARN_SORT_RE.match(w)
         if m:
             return (m.group(1), (m.group(2) or "").strip())
-        m2 = re.match(r"\[([^\]]+)\].*", w)
+        m2 = _WARN_CODE_RE.match(w)
         if m2:
             return (m2.group(1), w)
         return (w, "")
@@ -52,8 +97,12 @@ def _sort_warnings(warnings: list[str]) -> list[str]:
 
 def _normalize_line(line: str) -> str:
     """CRLF/LF -> LF, tab -> 2 spaces, strip trailing."""
-    s = line.replace("\r\n", "\n").replace("\r", "\n").expandtabs(2)
-    return s.rstrip()
+    # Each step only when its character is present; expandtabs is column-aware, so no regex swap
+    if "\r" in line:
+        line = line.replace("\r\n", "\n").replace("\r", "\n")
+    if "\t" in line:
+        line = line.expandtabs(2)
+    return line.rstrip()
 
 
 def _normalize_lines(lines: list[str]) -> list[str]:
@@ -67,24 +116,90 @@ MARKERS = {
     "FITTING": ("<!-- GENERATED:BEGIN:FITTING -->", "<!-- GENERATED:END:FITTING -->"),
     "GARMENT": ("<!-- GENERATED:BEGIN:GARMENT -->", "<!-- GENERATED:END:GARMENT -->"),
 }
+_ALL_MARKERS = tuple(m for pair in MARKERS.values() for m in pair)
+# _ensure_markers insertion points (DOTALL ".*?" rather than "[\s\S]*?": no per-char class test)
+_BLOCKERS_ANCHOR_RE = re.compile(
+    r"(## Manual \(ops auto-refresh checks\).*?open `ops/lab_roots\.local\.json`)\s*(\n---)", re.DOTALL
+)
+_M1_ANCHOR_RE = re.compile(r"(<!-- GENERATED:END:BLOCKERS -->)\s*(\n---)")
+_DASHBOARD_PATTERNS = {
+    module: re.compile(rf"(## {module.lower().capitalize()}.*?### Dashboard \(generated-only\)\s*\n)", re.DOTALL)
+    for module in MARKERS
+    if module not in {"BLOCKERS", "M1_SIGNALS"}
+}
+
+
+# RUN_LOG.txt headers (Rows:/Columns:) are written near the top; read the rest only if missing
+RUN_LOG_HEAD_BYTES = 64 * 1024
+_ROWS_RE = re.compile(rb"Rows?:\s*(\d+)", re.I)
+_COLS_RE = re.compile(rb"Columns?:\s*(\d+)", re.I)
 
 
 def _parse_run_log(run_log_path: Path) -> dict:
     """Parse RUN_LOG.txt for rows/cols/warnings. Returns dict with rows, cols, warnings."""
     out = {"rows": None, "cols": None, "warnings": []}
     try:
-        text = run_log_path.read_text(encoding="utf-8", errors="replace")
-        m = re.search(r"Rows?:\s*(\d+)", text, re.I)
-        if m:
-            out["rows"] = int(m.group(1))
-        m = re.search(r"Columns?:\s*(\d+)", text, re.I)
-        if m:
-            out["cols"] = int(m.group(1))
+        with open(run_log_path, "rb") as f:
+            data = f.read(RUN_LOG_HEAD_BYTES)
+            truncated = len(data) == RUN_LOG_HEAD_BYTES
+            # Search complete lines only, so a number cut at the boundary is never misread
+            head = data[: data.rfind(b"\n") + 1] if truncated else data
+            m_rows = _ROWS_RE.search(head)
+            m_cols = _COLS_RE.search(head)
+            if truncated and (m_rows is None or m_cols is None):
+                data += f.read()  # headers not near the top: fall back to the whole log
+                m_rows = m_rows or _ROWS_RE.search(data)
+                m_cols = m_cols or _COLS_RE.search(data)
+        if m_rows:
+            out["rows"] = int(m_rows.group(1))
+        if m_cols:
+            out["cols"] = int(m_cols.group(1))
     except Exception as e:
         out["warnings"].append(_warn("RUN_LOG_PARSE_FAIL", str(e), str(run_log_path)))
     return out
 
 
+def _rel_posix(path: Path, root: Path) -> str:
+    """POSIX path of path relative to root by string prefix (no Path.relative_to).
+    Raises ValueError when path is not under root, like relative_to."""
+    p, r = str(path), str(root)
+    if p == r:
+        return "."
+    prefix = r if r.endswith(os.sep) else r + os.sep
+    if not p.startswith(prefix):
+        raise ValueError(f"{p!r} is not under {r!r}")
+    return p[len(prefix):].replace(os.sep, "/")
+
+
+def _repo_rel(path: Path) -> str:
+    """POSIX path relative to the current REPO_ROOT; ValueError if outside it."""
+    return _rel_posix(path, REPO_ROOT)
+
+
+def _find_latest(base: Path, filename: str) -> tuple[Path, os.stat_result] | None:
+    """Newest file named filename under base (by mtime) with its stat; stats only the matches."""
+    best: os.DirEntry | None = None
+    best_st: os.stat_result | None = None
+    stack = [str(base)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name == filename and entry.is_file():
+                        st = entry.stat()
+                        if best_st is None or st.st_mtime > best_st.st_mtime:
+                            best, best_st = entry, st
+                except OSError:
+                    continue
+    return (Path(best.path), best_st) if best is not None else None
+
+
 def _latest_curated() -> tuple[dict, list[str]]:
     out = {
         "run_dir": "N/A",
@@ -101,21 +216,21 @@ def _latest_curated() -> tuple[dict, list[str]]:
         warnings.append(_warn("CURATED_NOT_FOUND", "data/derived/curated_v0 not found", "N/A"))
         return out, warnings
 
-    parquets = list(base.rglob("curated_v0.parquet"))
-    if not parquets:
+    found = _find_latest(base, "curated_v0.parquet")
+    if found is None:
         warnings.append(_warn("CURATED_PARQUET_NOT_FOUND", "no curated_v0.parquet found", str(base)))
         return out, warnings
 
-    latest_parquet = max(parquets, key=lambda p: p.stat().st_mtime)
+    latest_parquet, parquet_st = found
     latest_dir = latest_parquet.parent
-    run_id = latest_dir.relative_to(base).as_posix()
+    run_id = _rel_posix(latest_dir, base)
     out["run_id"] = run_id
     out["run_dir"] = f"data/derived/curated_v0/{run_id}"
-    out["parquet_path"] = str(latest_parquet.relative_to(REPO_ROOT).as_posix())
+    out["parquet_path"] = _repo_rel(latest_parquet)
 
     run_log = latest_dir / "RUN_LOG.txt"
     if run_log.exists():
-        out["run_log_path"] = run_log.relative_to(REPO_ROOT).as_posix()
+        out["run_log_path"] = _repo_rel(run_log)
         parsed = _parse_run_log(run_log)
         if parsed["rows"] is not None:
             out["rows"] = parsed["rows"]
@@ -123,29 +238,30 @@ def _latest_curated() -> tuple[dict, list[str]]:
             out["cols"] = parsed["cols"]
         warnings.extend(parsed["warnings"])
 
-    if out["rows"] is None or out["cols"] is None:
+    out["parquet_size"] = parquet_st.st_size
+    # Common path: RUN_LOG supplied both, so pyarrow is never imported
+    if out["rows"] is not None and out["cols"] is not None:
+        return out, warnings
+
+    try:
+        import pyarrow.parquet as pq
+        meta = pq.read_metadata(latest_parquet)
+        if out["rows"] is None:
+            out["rows"] = meta.num_rows
+        if out["cols"] is None:
+            out["cols"] = meta.num_columns
+    except ImportError:
         try:
-            import pyarrow.parquet as pq
-            meta = pq.read_metadata(latest_parquet)
+            import fastparquet  # footer metadata only; no DataFrame
+            pf = fastparquet.ParquetFile(str(latest_parquet))
             if out["rows"] is None:
-                out["rows"] = meta.num_rows
+                out["rows"] = pf.count()
             if out["cols"] is None:
-                out["cols"] = meta.num_columns
-        except ImportError:
-            try:
-                import pandas as pd
-                df = pd.read_parquet(latest_parquet, columns=[])
-                if out["rows"] is None:
-                    out["rows"] = len(df)
-                if out["cols"] is None:
-                    out["cols"] = len(df.columns)
-            except Exception as e:
-                warnings.append(_warn("CURATED_PARQUET_META_FAIL", str(e), str(latest_parquet)))
+                out["cols"] = len(pf.columns)
         except Exception as e:
             warnings.append(_warn("CURATED_PARQUET_META_FAIL", str(e), str(latest_parquet)))
-
-    if latest_parquet.exists():
-        out["parquet_size"] = latest_parquet.stat().st_size
+    except Exception as e:
+        warnings.append(_warn("CURATED_PARQUET_META_FAIL", str(e), str(latest_parquet)))
 
     return out, warnings
 
@@ -167,17 +283,16 @@ def _latest_geo() -> tuple[dict, list[str]]:
         warnings.append(_warn("GEO_FACTS_NOT_FOUND", "exports/runs not found", str(base)))
         return out, warnings
 
-    files = list(base.rglob("facts_summary.json"))
-    if not files:
+    found = _find_latest(base, "facts_summary.json")
+    if found is None:
         warnings.append(_warn("GEO_FACTS_NOT_FOUND", "no facts_summary.json found", str(base)))
         return out, warnings
 
-    latest = max(files, key=lambda p: p.stat().st_mtime)
-    out["path"] = str(latest.relative_to(REPO_ROOT).as_posix())
+    latest = found[0]
+    out["path"] = _repo_rel(latest)
 
     try:
-        with open(latest, encoding="utf-8") as f:
-            data = json.load(f)
+        data = _loads(latest.read_bytes())
         out["schema_version"] = data.get("schema_version")
         out["total"] = data.get("total_cases")
         out["processed"] = data.get("processed_cases")
@@ -191,6 +306,26 @@ def _latest_geo() -> tuple[dict, list[str]]:
     return out, warnings
 
 
+def _iter_lines_reverse(path: Path, block_size: int = TAIL_BLOCK_SIZE) -> Iterator[bytes]:
+    """Yield non-empty (stripped) lines of path newest-first, reading backward from EOF in blocks."""
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        rest = b""
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            parts = (f.read(step) + rest).split(b"\n")
+            rest = parts[0]
+            for raw in reversed(parts[1:]):
+                raw = raw.strip()
+                if raw:
+                    yield raw
+        rest = rest.strip()
+        if rest:
+            yield rest
+
+
 def _latest_body_progress(max_items: int = 3) -> list[dict]:
     """Read PROGRESS_LOG.jsonl, filter module=body, return last max_items events (facts-only)."""
     log_path = REPO_ROOT / "exports" / "progress" / "PROGRESS_LOG.jsonl"
@@ -198,18 +333,20 @@ def _latest_body_progress(max_items: int = 3) -> list[dict]:
         return []
     events = []
     try:
-        with open(log_path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    ev = json.loads(line)
-                    if ev.get("module") == "body":
-                        events.append(ev)
-                except json.JSONDecodeError:
-                    continue
-        return events[-max_items:] if events else []
+        # Append-only log: walk back from EOF and stop once max_items body events are found
+        for line in _iter_lines_reverse(log_path):
+            if len(events) >= max_items:
+                break
+            if b"body" not in line:
+                continue
+            try:
+                ev = json.loads(line)
+            except ValueError:
+                continue
+            if ev.get("module") == "body":
+                events.append(ev)
+        events.reverse()
+        return events
     except Exception:
         return []
 
@@ -217,36 +354,35 @@ def _latest_body_progress(max_items: int = 3) -> list[dict]:
 def _render_body(
     curated: dict, geo: dict, warnings: list[str], *, body_progress: list[dict] | None = None
 ) -> str:
-    try:
-        from zoneinfo import ZoneInfo
-        ts = datetime.now(ZoneInfo("Asia/Seoul")).strftime("%Y-%m-%d %H:%M:%S")
-    except ImportError:
-        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    ts = datetime.now(_TZ).strftime("%Y-%m-%d %H:%M:%S")
 
-    lines = [f"*Updated: {ts}*", ""]
+    buf = io.StringIO()
+    w = buf.write
+    w(f"*Updated: {ts}*\n\n")
     nw = len(warnings)
+    sorted_warnings = _sort_warnings(warnings)
     health = "OK (warnings=0)" if nw == 0 else f"WARN (warnings={nw})"
-    lines.append(f"- health: {health}")
+    w(f"- health: {health}\n")
     if nw > 0:
-        top3 = _sort_warnings(warnings)[:3]
-        lines.append(f"- health_summary: {'; '.join(top3)}")
-    lines.append("")
+        top3 = sorted_warnings[:3]
+        w(f"- health_summary: {'; '.join(top3)}\n")
+    w("\n")
 
-    lines.append("### Curated ingest")
-    lines.append(f"- run_dir: {curated['run_dir']}")
+    w("### Curated ingest\n")
+    w(f"- run_dir: {curated['run_dir']}\n")
     if curated["rows"] is not None and curated["cols"] is not None:
-        lines.append(f"- curated_v0.parquet: {curated['rows']} rows, {curated['cols']} cols")
+        w(f"- curated_v0.parquet: {curated['rows']} rows, {curated['cols']} cols\n")
         if curated["parquet_size"]:
-            lines.append(f"  - path: {curated['parquet_path']} ({curated['parquet_size']:,} bytes)")
+            w(f"  - path: {curated['parquet_path']} ({curated['parquet_size']:,} bytes)\n")
         else:
-            lines.append(f"  - path: {curated['parquet_path']}")
+            w(f"  - path: {curated['parquet_path']}\n")
     else:
-        lines.append(f"- curated_v0.parquet: N/A (path: {curated['parquet_path']})")
-    lines.append(f"- RUN_LOG: {curated['run_log_path']}")
-    lines.append("")
+        w(f"- curated_v0.parquet: N/A (path: {curated['parquet_path']})\n")
+    w(f"- RUN_LOG: {curated['run_log_path']}\n")
+    w("\n")
 
-    lines.append("### Geo runner facts")
-    lines.append(f"- facts_summary: {geo['path']}")
+    w("### Geo runner facts\n")
+    w(f"- facts_summary: {geo['path']}\n")
     if geo["total"] is not None or geo["processed"] is not None or geo["skipped"] is not None:
         parts = []
         if geo["total"] is not None:
@@ -255,37 +391,39 @@ def _render_body(
             parts.append(f"processed={geo['processed']}")
         if geo["skipped"] is not None:
             parts.append(f"skipped={geo['skipped']}")
-        lines.append(f"  - {' '.join(parts)}")
+        w(f"  - {' '.join(parts)}\n")
         opts = []
-        if geo.get("manifest_duplicate_case_id_count") is not None:
-            opts.append(f"duplicates={geo['manifest_duplicate_case_id_count']}")
-        if geo.get("record_missing_count") is not None:
-            opts.append(f"missing={geo['record_missing_count']}")
-        if geo.get("processed_sink_count") is not None:
-            opts.append(f"sink={geo['processed_sink_count']}")
+        for label, key in (
+            ("duplicates", "manifest_duplicate_case_id_count"),
+            ("missing", "record_missing_count"),
+            ("sink", "processed_sink_count"),
+        ):
+            val = geo.get(key)
+            if val is not None:
+                opts.append(f"{label}={val}")
         if opts:
-            lines.append(f"  - {', '.join(opts)}")
+            w(f"  - {', '.join(opts)}\n")
     else:
-        lines.append("  - N/A")
-    lines.append("")
+        w("  - N/A\n")
+    w("\n")
 
     if body_progress:
-        lines.append("### Latest progress")
+        w("### Latest progress\n")
         for ev in body_progress:
             note = ev.get("note", "")
             step_id = ev.get("step_id", "N/A")
             ts = ev.get("ts", "N/A")
             if note:
-                lines.append(f"- [{step_id}] {ts}: {note}")
-        lines.append("")
+                w(f"- [{step_id}] {ts}: {note}\n")
+        w("\n")
 
     if warnings:
-        lines.append("### Warnings")
-        for w in _sort_warnings(warnings):
-            lines.append(f"- {w}")
-        lines.append("")
+        w("### Warnings\n")
+        for warn in sorted_warnings:
+            w(f"- {warn}\n")
+        w("\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()[:-1]  # no trailing newline after the last line
 
 
 def _read_lab_progress_events(lab_root: Path, module: str, max_events: int = 50) -> list[dict]:
@@ -296,20 +434,19 @@ def _read_lab_progress_events(lab_root: Path, module: str, max_events: int = 50)
     mod_lower = module.lower()
     events = []
     try:
-        with open(log_path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    ev = json.loads(line)
-                    if ev.get("module", "").lower() == mod_lower:
-                        events.append(ev)
-                except json.JSONDecodeError:
-                    continue
+        for line in _iter_lines_reverse(log_path):
+            if len(events) >= max_events:
+                break
+            try:
+                ev = json.loads(line)
+            except ValueError:
+                continue
+            if ev.get("module", "").lower() == mod_lower:
+                events.append(ev)
     except Exception:
         return []
-    return events[-max_events:]
+    events.reverse()
+    return events
 
 
 def _compute_progress_hygiene(lab_root: Path, module: str) -> list[str]:
@@ -322,14 +459,9 @@ def _compute_progress_hygiene(lab_root: Path, module: str) -> list[str]:
     try:
         last_ts = events[-1].get("ts")
         if last_ts:
-            try:
-                dt = datetime.fromisoformat(last_ts.replace("Z", "+00:00"))
-            except Exception:
-                dt = None
+            dt = _parse_ts(last_ts)
             if dt:
                 now = datetime.now(timezone.utc)
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
                 if (now - dt) > timedelta(hours=24):
                     codes.append("STALE_PROGRESS")
     except Exception:
@@ -361,7 +493,7 @@ def _extract_gate_codes_from_events(events: list[dict]) -> list[str]:
                         codes.append(item)
         for w in ev.get("warnings") or []:
             if isinstance(w, str) and w.startswith("[") and "]" in w:
-                m = re.match(r"\[([^\]]+)\]", w)
+                m = _WARN_CODE_RE.match(w)
                 if m:
                     codes.append(m.group(1))
     return codes
@@ -419,7 +551,7 @@ def _classify_path(path: str) -> str:
 def _format_path_for_display(raw: str) -> str:
     """Display path; use basename + suffix if absolute."""
     path = raw.replace("\\", "/")
-    if path.startswith("/") or re.match(r"^[A-Za-z]:", path):
+    if path.startswith("/") or _WIN_DRIVE_RE.match(path):
         return f"{Path(path).name} (absolute path suppressed)"
     return path
 
@@ -482,13 +614,14 @@ def _extract_observed_paths(lab_root: Path, module: str, max_items: int = 3) ->
     return result, hygiene
 
 
-def _extract_raw_observed_paths(lab_root: Path, module: str, max_events: int = 30) -> list[str]:
-    """Extract raw path strings from PROGRESS_LOG for dependency matching."""
+def _extract_raw_observed_paths(lab_root: Path, module: str, max_events: int = 30) -> Iterator[str]:
+    """Yield unique raw path strings (forward-slashed) from PROGRESS_LOG for dependency matching."""
     log_path = lab_root / "exports" / "progress" / "PROGRESS_LOG.jsonl"
     if not log_path.exists():
-        return []
+        return
     mod_lower = module.lower()
-    events = []
+    # Only the last max_events module events are used; don't keep the rest
+    events: deque = deque(maxlen=max_events)
     try:
         with open(log_path, encoding="utf-8") as f:
             for line in f:
@@ -502,10 +635,9 @@ def _extract_raw_observed_paths(lab_root: Path, module: str, max_events: int = 3
                 except json.JSONDecodeError:
                     continue
     except Exception:
-        return []
+        return
     seen = set()
-    out = []
-    for ev in events[-max_events:]:
+    for ev in events:
         for key in ("evidence", "artifacts_touched", "evidence_paths", "observed_paths"):
             for item in (ev.get(key) or []):
                 if isinstance(item, str):
@@ -513,19 +645,26 @@ def _extract_raw_observed_paths(lab_root: Path, module: str, max_events: int = 3
                     raw = raw.replace("\\", "/").strip()
                     if raw and raw not in seen:
                         seen.add(raw)
-                        out.append(raw)
-    return out
+                        yield raw
+
+
+@functools.lru_cache(maxsize=4)
+def _load_lab_roots_config(path: Path) -> dict:
+    """Parsed lab_roots.local.json (once per path per process); {} if missing/unreadable."""
+    try:
+        cfg = _loads(path.read_bytes())
+    except Exception:
+        return {}
+    return cfg if isinstance(cfg, dict) else {}
 
 
 def _get_lab_root(module: str) -> str:
     """Lab root: (1) ENV, (2) lab_roots.local.json, (3) empty. Returns resolved path or ''."""
     env_key = "FITTING_LAB_ROOT" if module == "FITTING" else "GARMENT_LAB_ROOT"
     lab_root = os.environ.get(env_key, "").strip()
-    if not lab_root and LAB_ROOTS_PATH.exists():
+    if not lab_root:
         try:
-            with open(LAB_ROOTS_PATH, encoding="utf-8") as f:
-                cfg = json.load(f)
-            val = (cfg.get(env_key) or "").strip()
+            val = (_load_lab_roots_config(LAB_ROOTS_PATH).get(env_key) or "").strip()
             if val:
                 lab_root = str((REPO_ROOT / val).resolve())
         except Exception:
@@ -548,10 +687,10 @@ def _read_lab_brief(module: str) -> tuple[dict, list[str]]:
         warnings.append(_warn("LAB_ROOT_NOT_FOUND", f"{env_key} path not found", str(root)))
         return out, warnings
 
-    brief_name = f"{module}_WORK_BRIEF.md"
-    brief_path = root / "exports" / "brief" / brief_name
-    if not brief_path.exists():
-        warnings.append(_warn("BRIEF_NOT_FOUND", "brief not found", str(brief_path)))
+    # Only ever used as a string (exists/stat/open/display); skip the Path joins
+    brief_path = os.path.join(root, "exports", "brief", f"{module}_WORK_BRIEF.md")
+    if not os.path.exists(brief_path):
+        warnings.append(_warn("BRIEF_NOT_FOUND", "brief not found", brief_path))
         return out, warnings
 
     observed_paths, path_hygiene = _extract_observed_paths(root, module, max_items=3)
@@ -559,19 +698,19 @@ def _read_lab_brief(module: str) -> tuple[dict, list[str]]:
     out["path_hygiene"] = path_hygiene
     out["progress_hygiene"] = _compute_progress_hygiene(root, module)
     try:
-        out["brief_path"] = str(brief_path)
-        mtime = brief_path.stat().st_mtime
-        try:
-            from zoneinfo import ZoneInfo
-            dt = datetime.fromtimestamp(mtime, tz=ZoneInfo("Asia/Seoul"))
-        except ImportError:
-            dt = datetime.fromtimestamp(mtime)
+        out["brief_path"] = brief_path
+        mtime = os.stat(brief_path).st_mtime
+        dt = datetime.fromtimestamp(mtime, tz=_TZ)
         out["brief_mtime"] = dt.strftime("%Y-%m-%d %H:%M:%S")
-        raw = brief_path.read_text(encoding="utf-8", errors="replace")
-        lines = raw.replace("\r\n", "\n").replace("\r", "\n").split("\n")
-        out["brief_head"] = _normalize_lines(lines[:12])
+        # Universal-newline text mode; stop after the 12 head lines
+        with open(brief_path, encoding="utf-8", errors="replace") as f:
+            raw = list(itertools.islice(f, 12))
+        lines = [ln.rstrip("\n") for ln in raw]
+        if len(raw) < 12 and (not raw or raw[-1].endswith("\n")):
+            lines.append("")  # keep the empty tail piece str.split("\n") produced
+        out["brief_head"] = _normalize_lines(lines)
     except Exception as e:
-        warnings.append(_warn("BRIEF_READ_FAIL", str(e), str(brief_path)))
+        warnings.append(_warn("BRIEF_READ_FAIL", str(e), brief_path))
 
     return out, warnings
 
@@ -596,10 +735,11 @@ def _render_module_brief(module: str, brief: dict, warnings: list[str]) -> str:
     soft_warns = [_warn(c, "observed", "N/A") for c in soft]
     all_w = warnings + soft_warns
     nw = len(all_w)
+    sorted_w = _sort_warnings(all_w)
     health = "OK (warnings=0)" if nw == 0 else f"WARN (warnings={nw})"
     lines = [f"- health: {health}"]
     if nw > 0:
-        top3 = _sort_warnings(all_w)[:3]
+        top3 = sorted_w[:3]
         lines.append(f"- health_summary: {'; '.join(top3)}")
     lines.append(f"- brief_path: {brief['brief_path']}")
     lines.append(f"- brief_mtime: {brief['brief_mtime']}")
@@ -616,23 +756,23 @@ def _render_module_brief(module: str, brief: dict, warnings: list[str]) -> str:
             lines.append(f"  {ln}")
     if all_w:
         lines.append("- warnings:")
-        for w in _sort_warnings(all_w):
+        for w in sorted_w:
             lines.append(f"  - {w}")
     return "\n".join(lines)
 
 
 def _ensure_markers(text: str) -> str:
     """If any markers missing, insert placeholder."""
+    if all(m in text for m in _ALL_MARKERS):
+        return text
     if "<!-- GENERATED:BEGIN:BLOCKERS -->" not in text:
         # Insert BLOCKERS block after Manual section, before ---
-        pattern = r"(## Manual \(ops auto-refresh checks\)[\s\S]*?open `ops/lab_roots\.local\.json`)\s*(\n---)"
-        match = re.search(pattern, text)
+        match = _BLOCKERS_ANCHOR_RE.search(text)
         if match:
             insert = f"\n\n## BLOCKERS (generated)\n<!-- GENERATED:BEGIN:BLOCKERS -->\n- BLOCKERS: none observed\n<!-- GENERATED:END:BLOCKERS -->"
             text = text[: match.end(1)] + insert + text[match.start(2) :]
     if "<!-- GENERATED:BEGIN:M1_SIGNALS -->" not in text:
-        pattern = r"(<!-- GENERATED:END:BLOCKERS -->)\s*(\n---)"
-        match = re.search(pattern, text)
+        match = _M1_ANCHOR_RE.search(text)
         if match:
             insert = (
                 "\n\n## M1 Signals (generated)\n"
@@ -643,13 +783,10 @@ def _ensure_markers(text: str) -> str:
                 "<!-- GENERATED:END:M1_SIGNALS -->"
             )
             text = text[: match.end(1)] + insert + text[match.start(2) :]
-    for module, (mb, me) in MARKERS.items():
-        if module in {"BLOCKERS", "M1_SIGNALS"}:
-            continue
+    for module, pattern in _DASHBOARD_PATTERNS.items():
+        mb, me = MARKERS[module]
         if mb not in text or me not in text:
-            section = module.lower().capitalize()
-            pattern = rf"(## {section}[\s\S]*?### Dashboard \(generated-only\)\s*\n)"
-            match = re.search(pattern, text)
+            match = pattern.search(text)
             if match:
                 placeholder = f"- N/A (placeholder)\n" if module != "BODY" else "- N/A\n"
                 insert = match.group(0) + f"{mb}\n{placeholder}{me}\n"
@@ -657,6 +794,26 @@ def _ensure_markers(text: str) -> str:
     return text
 
 
+def _replace_marker_blocks(text: str, content_map: dict[str, str]) -> str:
+    """
+    For each module in content_map (MARKERS order), replace the first BEGIN and the first END
+    after it with the new block, by find/slice (no regex, content inserted literally).
+    Modules whose BEGIN has no END after it are left untouched; the others are still updated.
+    """
+    for module, (mb, me) in MARKERS.items():
+        content = content_map.get(module)
+        if content is None:
+            continue
+        i = text.find(mb)
+        if i == -1:
+            continue
+        j = text.find(me, i + len(mb))
+        if j == -1:
+            continue
+        text = f"{text[:i]}{mb}\n{content}\n{me}{text[j + len(me):]}"
+    return text
+
+
 def _load_dependency_ledger() -> dict | None:
     """Load contracts/dependency_ledger_v1.json. Returns None on error."""
     path = REPO_ROOT / "contracts" / "dependency_ledger_v1.json"
@@ -669,37 +826,43 @@ def _load_dependency_ledger() -> dict | None:
         return None
 
 
-def _path_matches_glob(path: str, pattern: str) -> bool:
-    """Check if path matches glob pattern (supports **). Uses fnmatch; ** = any path segments."""
-    import fnmatch
-
-    pnorm = path.replace("\\", "/")
+@functools.lru_cache(maxsize=256)
+def _glob_predicate(pattern: str):
+    """Compile a glob once into a predicate over forward-slashed paths (see _path_matches_glob)."""
     pnorm_pat = pattern.replace("\\", "/")
     if "**" not in pnorm_pat:
-        return fnmatch.fnmatch(pnorm, pnorm_pat)
+        # fnmatch.fnmatch == normcase both sides + translate(); the regex is built once here
+        match = re.compile(fnmatch.translate(os.path.normcase(pnorm_pat))).match
+        return lambda p: match(os.path.normcase(p)) is not None
     parts = pnorm_pat.split("**", 1)
     prefix, suffix = parts[0].rstrip("/"), (parts[1].lstrip("/") if len(parts) > 1 else "")
     if not prefix and not suffix:
-        return True
-    if prefix and not pnorm.startswith(prefix):
-        return False
-    if suffix and not pnorm.endswith(suffix):
-        return False
-    if prefix and suffix and len(pnorm) < len(prefix) + len(suffix):
-        return False
-    return True
+        return lambda p: True
+    min_len = len(prefix) + len(suffix) if prefix and suffix else 0
+
+    def _pred(p: str) -> bool:
+        if prefix and not p.startswith(prefix):
+            return False
+        if suffix and not p.endswith(suffix):
+            return False
+        return len(p) >= min_len
+
+    return _pred
+
+
+def _path_matches_glob(path: str, pattern: str) -> bool:
+    """Check if path matches glob pattern (supports **). Uses fnmatch; ** = any path segments."""
+    return _glob_predicate(pattern)(path.replace("\\", "/"))
 
 
 def _collect_global_observed_paths(lab_roots: list[tuple[Path, str]]) -> set[str]:
     """Collect all raw observed paths from progress logs and run_registry."""
     out = set()
     for lab_root, module in lab_roots:
-        for p in _extract_raw_observed_paths(lab_root, module, max_events=50):
-            out.add(p.replace("\\", "/"))
+        out.update(_extract_raw_observed_paths(lab_root, module, max_events=50))
     body_progress_path = REPO_ROOT / "exports" / "progress" / "PROGRESS_LOG.jsonl"
     if body_progress_path.exists():
-        for p in _extract_raw_observed_paths(REPO_ROOT, "body", max_events=50):
-            out.add(p.replace("\\", "/"))
+        out.update(_extract_raw_observed_paths(REPO_ROOT, "body", max_events=50))
     registry_path = REPO_ROOT / "ops" / "run_registry.jsonl"
     if registry_path.exists():
         try:
@@ -726,8 +889,7 @@ def _collect_global_observed_paths(lab_roots: list[tuple[Path, str]]) -> set[str
         for name in ("body_measurements_subset.json", "garment_proxy_meta.json"):
             for p in runs_root.rglob(name):
                 try:
-                    rel = p.relative_to(REPO_ROOT).as_posix()
-                    out.add(rel)
+                    out.add(_repo_rel(p))
                 except ValueError:
                     pass
 
@@ -736,13 +898,10 @@ def _collect_global_observed_paths(lab_roots: list[tuple[Path, str]]) -> set[str
         if lab_root and lab_root.exists():
             runs_in_lab = lab_root / "exports" / "runs"
             if runs_in_lab.exists():
+                lab_prefix = str(lab_root) + os.sep
                 for name in ("body_measurements_subset.json", "garment_proxy_meta.json"):
                     for p in runs_in_lab.rglob(name):
-                        try:
-                            rel = p.relative_to(lab_root).as_posix()
-                            out.add(rel)
-                        except ValueError:
-                            pass
+                        out.add(str(p).removeprefix(lab_prefix).replace(os.sep, "/"))
 
     return out
 
@@ -786,8 +945,9 @@ def _evaluate_m1_checks(checks: dict, data: dict) -> list[str]:
     keys_any = checks.get("require_keys_any")
     if keys_any:
         targets = [data]
-        if checks.get("require_keys_any_in"):
-            sub = data.get(checks["require_keys_any_in"])
+        keys_any_in = checks.get("require_keys_any_in")
+        if keys_any_in:
+            sub = data.get(keys_any_in)
             if isinstance(sub, dict):
                 targets.append(sub)
         found = False
@@ -934,6 +1094,31 @@ RUN_MINSET_README = "RUN_README.md"
 RUN_MINSET_MIN_COUNT = 2
 
 
+def _scan_run_minset(run_dir: Path) -> tuple[bool, bool, bool]:
+    """
+    (has geometry_manifest, has *facts_summary*.json, has RUN_README.md/README.txt) anywhere under
+    run_dir, in one walk that stops as soon as all three are seen (same matches as the rglobs).
+    """
+    # Conventional layout keeps all three at the run root: probe those literals before walking
+    base = str(run_dir)
+    has_geo = os.path.exists(os.path.join(base, "geometry_manifest.json"))
+    has_facts = os.path.exists(os.path.join(base, "facts_summary.json"))
+    has_readme = os.path.exists(os.path.join(base, "RUN_README.md")) or os.path.exists(os.path.join(base, "README.txt"))
+    if has_geo and has_facts and has_readme:
+        return True, True, True
+    for _dirpath, dirnames, filenames in os.walk(run_dir):
+        for name in itertools.chain(dirnames, filenames):
+            if not has_geo and fnmatch.fnmatch(name, "geometry_manifest.json"):
+                has_geo = True
+            elif not has_facts and fnmatch.fnmatch(name, "*facts_summary*.json"):
+                has_facts = True
+            elif not has_readme and (fnmatch.fnmatch(name, "RUN_README.md") or fnmatch.fnmatch(name, "README.txt")):
+                has_readme = True
+        if has_geo and has_facts and has_readme:
+            break
+    return has_geo, has_facts, has_readme
+
+
 def _check_run_minset(lab_roots: list[tuple[Path, str]], max_records: int = 50) -> dict[str, list[str]]:
     """
     Check run_registry records for minset (>=2 of geometry_manifest, facts_summary, RUN_README).
@@ -985,9 +1170,7 @@ def _check_run_minset(lab_roots: list[tuple[Path, str]], max_records: int = 50)
 
         count = 0
         missing = []
-        has_geo = bool(list(run_dir.rglob("geometry_manifest.json")))
-        has_facts = bool(list(run_dir.rglob("facts_summary.json")) or list(run_dir.rglob("*facts_summary*.json")))
-        has_readme = bool(list(run_dir.rglob("RUN_README.md")) or list(run_dir.rglob("README.txt")))
+        has_geo, has_facts, has_readme = _scan_run_minset(run_dir)
         if has_geo:
             count += 1
         else:
@@ -1013,6 +1196,59 @@ def _check_run_minset(lab_roots: list[tuple[Path, str]], max_records: int = 50)
     return result, root_result
 
 
+def _iter_log_events(path: Path) -> Iterator[dict]:
+    """
+    Yield parsed JSON objects from a JSONL file, skipping blank/invalid lines.
+    Large files are scanned through mmap so only touched pages are resident.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return
+        if size < MMAP_MIN_BYTES:
+            buf = f.read()
+            mm = None
+        else:
+            buf = mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            start = 0
+            while start < size:
+                end = buf.find(b"\n", start)
+                if end == -1:
+                    end = size
+                line = buf[start:end].strip()
+                start = end + 1
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+        finally:
+            if mm is not None:
+                mm.close()
+
+
+def _count_rounds(log_path: Path, module: str, cutoff: datetime, counts: list[int]) -> None:
+    """
+    Add round_start/round_end counts for module with ts at or after cutoff to
+    counts ([start, end]) in place, so counts gathered before a read error survive it.
+    """
+    for ev in _iter_log_events(log_path):
+        if ev.get("module", "").lower() != module:
+            continue
+        ts = ev.get("ts", "")
+        if ts:
+            dt = _parse_ts(ts)
+            if dt is not None and dt < cutoff:
+                continue
+        et = str(ev.get("event_type") or ev.get("event") or "").lower()
+        if et == "round_start":
+            counts[0] += 1
+        elif et == "round_end":
+            counts[1] += 1
+
+
 def _check_round_end_missing(lab_roots: list[tuple[Path, str]], hours: int = 24) -> dict[str, list[str]]:
     """
     Count-based: if ROUND_START > ROUND_END in last 24h, add ROUND_END_MISSING. Warn-only.
@@ -1026,73 +1262,23 @@ def _check_round_end_missing(lab_roots: list[tuple[Path, str]], hours: int = 24)
         log_path = lab_root / "exports" / "progress" / "PROGRESS_LOG.jsonl"
         if not log_path.exists():
             continue
-        start_count = 0
-        end_count = 0
+        counts = [0, 0]
         try:
-            with open(log_path, encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        ev = json.loads(line)
-                        if ev.get("module", "").lower() != module.lower():
-                            continue
-                        ts = ev.get("ts", "")
-                        if ts:
-                            try:
-                                dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                                if dt.tzinfo is None:
-                                    dt = dt.replace(tzinfo=timezone.utc)
-                                if dt < cutoff:
-                                    continue
-                            except Exception:
-                                pass
-                        et = str(ev.get("event_type") or ev.get("event") or "").lower()
-                        if et == "round_start":
-                            start_count += 1
-                        elif et == "round_end":
-                            end_count += 1
-                    except json.JSONDecodeError:
-                        continue
+            _count_rounds(log_path, module.lower(), cutoff, counts)
         except Exception:
             continue
+        start_count, end_count = counts
         if start_count > end_count:
             result[mod_upper].append("expected=roundwrap end required")
 
     body_log = REPO_ROOT / "exports" / "progress" / "PROGRESS_LOG.jsonl"
     if body_log.exists():
-        start_count = 0
-        end_count = 0
+        counts = [0, 0]
         try:
-            with open(body_log, encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        ev = json.loads(line)
-                        if ev.get("module", "").lower() != "body":
-                            continue
-                        ts = ev.get("ts", "")
-                        if ts:
-                            try:
-                                dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                                if dt.tzinfo is None:
-                                    dt = dt.replace(tzinfo=timezone.utc)
-                                if dt < cutoff:
-                                    continue
-                            except Exception:
-                                pass
-                        et = str(ev.get("event_type") or ev.get("event") or "").lower()
-                        if et == "round_start":
-                            start_count += 1
-                        elif et == "round_end":
-                            end_count += 1
-                    except json.JSONDecodeError:
-                        continue
+            _count_rounds(body_log, "body", cutoff, counts)
         except Exception:
             pass
+        start_count, end_count = counts
         if start_count > end_count:
             result["BODY"].append("expected=roundwrap end required")
 
@@ -1137,17 +1323,19 @@ def _render_m1_signals() -> str:
 
 
 def main() -> int:
-    all_warnings = []
+    # Nothing to render into without STATUS.md; bail before the curated/geo/lab scans
+    try:
+        original = OPS_STATUS.read_text(encoding="utf-8")
+    except Exception:
+        print("ops/STATUS.md unreadable, skipped (nothing written)")
+        return 0
 
     curated, w1 = _latest_curated()
     geo, w2 = _latest_geo()
-    all_warnings.extend(w1)
-    all_warnings.extend(w2)
-
     fitting_brief, w3 = _read_lab_brief("FITTING")
     garment_brief, w4 = _read_lab_brief("GARMENT")
-    all_warnings.extend(w3)
-    all_warnings.extend(w4)
+    n_warnings = len(w1) + len(w2) + len(w3) + len(w4)
+    w1.extend(w2)  # BODY block renders curated + geo warnings together
 
     fit_r = _get_lab_root("FITTING")
     gar_r = _get_lab_root("GARMENT")
@@ -1208,17 +1396,11 @@ def main() -> int:
         w4.append(_warn_dep("ROUND_END_MISSING", "hygiene", expected))
 
     body_progress = _latest_body_progress(max_items=3)
-    body_content = _render_body(curated, geo, w1 + w2, body_progress=body_progress)
+    body_content = _render_body(curated, geo, w1, body_progress=body_progress)
     fitting_content = _render_module_brief("FITTING", fitting_brief, w3)
     garment_content = _render_module_brief("GARMENT", garment_brief, w4)
 
-    try:
-        text = OPS_STATUS.read_text(encoding="utf-8")
-    except Exception as e:
-        print(f"updated ops/STATUS.md (BODY/FITTING/GARMENT/M1), warnings={len(all_warnings)+1}")
-        return 0
-
-    text = _ensure_markers(text)
+    text = _ensure_markers(original)
 
     content_map = {
         "BLOCKERS": blockers_content,
@@ -1227,25 +1409,25 @@ def main() -> int:
         "FITTING": fitting_content,
         "GARMENT": garment_content,
     }
-    for module, (mb, me) in MARKERS.items():
-        content = content_map.get(module)
-        if content is None:
-            continue
-        block = f"{mb}\n{content}\n{me}"
-        if mb in text and me in text:
-            def replacer(m, b=block):
-                return b
-            text = re.sub(rf"{re.escape(mb)}[\s\S]*?{re.escape(me)}", replacer, text, count=1)
+    text = _replace_marker_blocks(text, content_map)
+    if text == original:
+        # Same content as on disk: skip the tmp write + rename
+        print(f"updated ops/STATUS.md (BODY/FITTING/GARMENT/M1), warnings={n_warnings}")
+        return 0
 
+    tmp_path = OPS_STATUS.parent / f"STATUS.md.tmp.{os.getpid()}"
     try:
-        tmp_path = OPS_STATUS.parent / f"STATUS.md.tmp.{os.getpid()}"
         tmp_path.write_text(text, encoding="utf-8")
         os.replace(tmp_path, OPS_STATUS)
     except Exception as e:
-        print(f"updated ops/STATUS.md (BODY/FITTING/GARMENT/M1), warnings={len(all_warnings)+1}")
+        try:
+            tmp_path.unlink(missing_ok=True)  # don't leave a stray tmp next to STATUS.md
+        except OSError:
+            pass
+        print(f"updated ops/STATUS.md (BODY/FITTING/GARMENT/M1), warnings={n_warnings + 1}")
         return 0
 
-    print(f"updated ops/STATUS.md (BODY/FITTING/GARMENT/M1), warnings={len(all_warnings)}")
+    print(f"updated ops/STATUS.md (BODY/FITTING/GARMENT/M1), warnings={n_warnings}")
     return 0
 
 